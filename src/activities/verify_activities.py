@@ -3,7 +3,7 @@
 Each activity is a single unit of work that the Temporal worker executes.
 Activities can be retried independently if they fail.
 
-The verification pipeline has 7 activities:
+The verification pipeline has 9 activities:
   0. create_claim             — creates a claim record in the DB (when started from Temporal UI)
   1. decompose_claim          — normalize + extract facts + Wikidata expansion (2 LLM calls)
   2. research_subclaim        — seed search + MBFC→Wikidata + rank + ReAct agent + LegiScan + evidence NER
@@ -11,6 +11,11 @@ The verification pipeline has 7 activities:
   4. synthesize_verdict       — LLM combines sub-verdicts into final verdict
   5. store_result             — writes result tree to Postgres
   6. start_next_queued_claim  — picks up next queued claim and starts its workflow
+  7. finalize_claim           — store_result + start_next_queued_claim in one activity
+  8. research_and_judge       — research_subclaim + judge_subclaim in one activity (single-fact claims)
+
+decompose/research/judge results are cached in-process by content hash of
+their inputs and the serving model (src/utils/activity_cache.py).
 
 The pipeline is flat: decompose once → research each fact → judge each fact → synthesize.
 Follows Google's SAFE and FActScore.
@@ -29,9 +34,58 @@ from sqlalchemy import select
 from temporalio import activity
 
 from src.db.session import async_session
-from src.db.models import Claim, SubClaim, Evidence, Verdict, InterestedParty
+from src.db.models import (
+    Claim, SubClaim, Evidence, Verdict, InterestedParty, DecompositionCache,
+)
+from src.utils.activity_cache import cached, content_key
 from src.utils.logging import log
 
+# Result cache TTLs — identical inputs within the window reuse the prior
+# result instead of re-running the LLM pipeline. Evidence ages faster than
+# a decomposition, so research/judge expire sooner.
+DECOMPOSE_CACHE_TTL = 24 * 3600
+RESEARCH_CACHE_TTL = 6 * 3600
+JUDGE_CACHE_TTL = 6 * 3600
+
+
+def _model_scoped_key(name: str):
+    """Cache key over the activity inputs plus the serving model, so a
+    model swap never returns results produced by the previous one."""
+    def key(*args, **kwargs) -> str:
+        from src.llm.client import MODEL
+        return content_key(name, MODEL, args, kwargs)
+    return key
+
+
+def _is_llm_decomposition(result: dict) -> bool:
+    """False for decompose's LLM-failure fallback (claim as a single fact,
+    no normalized_claim), which must not be cached."""
+    return "normalized_claim" in result.get("thesis_info", {})
+
+
+def _has_evidence(result: dict) -> bool:
+    """False when research came back empty (e.g. search APIs down)."""
+    return bool(result.get("evidence"))
+
+
+def _is_judged(result: dict) -> bool:
+    """False for judge's unverifiable/0.0 result — an LLM invocation
+    failure or no evidence — so the next attempt retries it."""
+    return not (result.get("verdict") == "unverifiable"
+                and not result.get("confidence"))
+
+
+def _decompose_key(claim_text: str, speaker: str | None = None,
+                   claim_date: str | None = None,
+                   transcript_title: str | None = None,
+                   speaker_description: str = "") -> str:
+    """Decompose cache key — whitespace-normalized claim text, so the same
+    claim re-submitted with different spacing still hits."""
+    from src.llm.client import MODEL
+    return content_key("decompose_claim", MODEL, " ".join(claim_text.split()),
+                       speaker, claim_date, transcript_title,
+                       speaker_description)
+
 
 @activity.defn
 async def create_claim(
@@ -67,6 +121,8 @@ async def create_claim(
 
 
 @activity.defn
+@cached(ttl_seconds=DECOMPOSE_CACHE_TTL, key=_decompose_key,
+        should_cache=_is_llm_decomposition)
 async def decompose_claim(claim_text: str, speaker: str | None = None,
                           claim_date: str | None = None,
                           transcript_title: str | None = None,
@@ -75,24 +131,90 @@ async def decompose_claim(claim_text: str, speaker: str | None = None,
 
     Delegates to src/agent/decompose.decompose() for all domain logic.
     If speaker is provided, they're automatically added as an interested party.
+
+    thesis_info["interested_parties"] is always returned in the canonical
+    dict form, so the workflow never has to normalize legacy list output.
     """
     log.info(activity.logger, "decompose", "start", "Decomposing claim",
              claim_length=len(claim_text), speaker=speaker,
              claim_date=claim_date,
              transcript_title=transcript_title,
              has_speaker_desc=bool(speaker_description))
-    from src.agent.decompose import decompose
+
+    # Durable cache (Postgres) — survives worker restarts and is shared
+    # across workers, unlike the in-process @cached layer above
+    cache_key = _decompose_key(claim_text, speaker, claim_date,
+                               transcript_title, speaker_description)
+    cached_result = await _load_decomposition(cache_key)
+    if cached_result is not None:
+        log.info(activity.logger, "decompose", "cache_hit",
+                 "Reusing stored decomposition",
+                 fact_count=len(cached_result.get("facts", [])))
+        return cached_result
+
+    from src.agent.decompose import decompose, normalize_interested_parties
     result = await decompose(claim_text, speaker=speaker,
                              claim_date=claim_date,
                              transcript_title=transcript_title,
                              speaker_description=speaker_description)
+
+    thesis_info = result.setdefault("thesis_info", {})
+    parties = thesis_info.get("interested_parties")
+    if not isinstance(parties, dict):
+        thesis_info["interested_parties"] = normalize_interested_parties(parties or [])
     log.info(activity.logger, "decompose", "done", "Decompose complete",
              fact_count=len(result.get("facts", [])),
-             thesis=result.get("thesis_info", {}).get("thesis", "")[:80])
+             thesis=(thesis_info.get("thesis") or "")[:80])
+
+    # Only real LLM decompositions are stored, never the LLM-failure fallback
+    if _is_llm_decomposition(result):
+        await _store_decomposition(cache_key, result)
     return result
 
 
+async def _load_decomposition(cache_key: str) -> dict | None:
+    """Fetch a fresh stored decomposition, or None (miss, stale, DB error)."""
+    try:
+        async with async_session() as session:
+            row = await session.get(DecompositionCache, cache_key)
+    except Exception as e:
+        log.warning(activity.logger, "decompose", "cache_read_failed",
+                    "Decomposition cache read failed", error=str(e))
+        return None
+    if row is None:
+        return None
+    age = (datetime.now(timezone.utc) - row.created_at).total_seconds()
+    if age > DECOMPOSE_CACHE_TTL:
+        return None
+    return row.result
+
+
+async def _store_decomposition(cache_key: str, result: dict) -> None:
+    """Upsert a decomposition into the durable cache (best-effort)."""
+    from sqlalchemy.dialects.postgresql import insert
+    from src.llm.client import MODEL
+    now = datetime.now(timezone.utc)
+    try:
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(DecompositionCache).values(
+                        cache_key=cache_key, model=MODEL,
+                        result=result, created_at=now,
+                    ).on_conflict_do_update(
+                        index_elements=["cache_key"],
+                        set_={"model": MODEL, "result": result,
+                              "created_at": now},
+                    )
+                )
+    except Exception as e:
+        log.warning(activity.logger, "decompose", "cache_write_failed",
+                    "Decomposition cache write failed", error=str(e))
+
+
 @activity.defn
+@cached(ttl_seconds=RESEARCH_CACHE_TTL, key=_model_scoped_key("research_subclaim"),
+        should_cache=_has_evidence)
 async def research_subclaim(
     sub_claim: str,
     interested_parties: dict | None = None,
@@ -107,6 +229,13 @@ async def research_subclaim(
 
     Delegates to src/agent/research.research_claim() for all domain logic.
 
+    Evidence below the ranker's CONTENT_FLOOR (hub pages, failed fetches)
+    is dropped here — the judge would discard it anyway, so it never needs
+    to cross the activity boundary. Quality ranking and the
+    MAX_JUDGE_EVIDENCE cap stay in the judge: they read cached MBFC
+    ratings, and background scrapes started during research may still be
+    landing.
+
     Returns dict with:
         - evidence: list of evidence dicts
         - enriched_parties: InterestedPartiesDict with new parties/media
@@ -127,12 +256,20 @@ async def research_subclaim(
         transcript_title=transcript_title,
     )
 
+    from src.utils.evidence_ranker import CONTENT_FLOOR
+    found = len(evidence)
+    evidence = [ev for ev in evidence
+                if len(ev.get("content", "") or "") >= CONTENT_FLOOR]
+
     log.info(activity.logger, "research", "done", "Research complete",
-             sub_claim=sub_claim, evidence_count=len(evidence))
+             sub_claim=sub_claim, evidence_count=len(evidence),
+             no_content_dropped=found - len(evidence))
     return {"evidence": evidence, "enriched_parties": dict(enriched_parties)}
 
 
 @activity.defn
+@cached(ttl_seconds=JUDGE_CACHE_TTL, key=_model_scoped_key("judge_subclaim"),
+        should_cache=_is_judged)
 async def judge_subclaim(
     claim_text: str,
     sub_claim: str,
@@ -170,6 +307,73 @@ async def judge_subclaim(
     return result
 
 
+@activity.defn
+async def research_and_judge(
+    claim_text: str,
+    sub_claim: str,
+    interested_parties: dict,
+    categories: list[str] | None = None,
+    seed_queries: list[str] | None = None,
+    speaker: str | None = None,
+    claim_date: str | None = None,
+    transcript_title: str | None = None,
+    verification_target: str = "",
+    key_test: str = "",
+    max_all_parties: int = 40,
+) -> dict:
+    """Research and judge one fact in a single activity.
+
+    Used for single-fact claims, where there are no sibling facts whose
+    enriched parties need merging before the judge runs. Saves one
+    activity round-trip, and the evidence never passes through workflow
+    history.
+
+    Research output is recorded in heartbeat details, which Temporal
+    carries across retries, so a judge failure never re-runs research.
+
+    Returns dict with:
+        - judgment: the judge_subclaim result
+        - evidence_count: evidence items research returned
+        - party_count: interested parties the judge saw
+    """
+    details = activity.info().heartbeat_details
+    researched: dict | None = details[0] if details else None
+
+    if researched is None:
+        researched = await research_subclaim(
+            sub_claim, interested_parties, categories, seed_queries,
+            speaker, claim_date, claim_text, transcript_title,
+        )
+        activity.heartbeat(researched)
+    else:
+        log.info(activity.logger, "research_and_judge", "resume",
+                 "Reusing research from previous attempt",
+                 sub_claim=sub_claim[:80],
+                 evidence_count=len(researched.get("evidence", [])))
+
+    # Same merge the workflow does across facts, for this fact alone
+    enriched = researched.get("enriched_parties") or {}
+    all_parties = list(dict.fromkeys(
+        interested_parties.get("all_parties", []) + enriched.get("all_parties", [])
+    ))[:max_all_parties]
+    affiliated_media = list(dict.fromkeys(
+        interested_parties.get("affiliated_media", [])
+        + enriched.get("affiliated_media", [])
+    ))
+    merged = {**interested_parties, "all_parties": all_parties,
+              "affiliated_media": affiliated_media}
+
+    judgment = await judge_subclaim(
+        claim_text, sub_claim, researched["evidence"], merged, speaker,
+        claim_date, verification_target, transcript_title, key_test,
+    )
+    return {
+        "judgment": judgment,
+        "evidence_count": len(researched["evidence"]),
+        "party_count": len(all_parties),
+    }
+
+
 @activity.defn
 async def synthesize_verdict(
     claim_text: str,
@@ -413,3 +617,68 @@ async def start_next_queued_claim() -> str | None:
              claim_id=claim_id)
 
     return claim_id
+
+
+@activity.defn
+async def finalize_claim(
+    claim_id: str,
+    result: dict,
+    thesis_info: dict | None = None,
+    atomic_facts: list[dict] | None = None,
+    chain_queue: bool = True,
+) -> str | None:
+    """Store the result and (optionally) start the next queued claim.
+
+    Fuses store_result and start_next_queued_claim so the end of the
+    workflow costs one activity round-trip instead of two. Synthesis stays
+    a separate activity — it's an LLM call with its own timeout, and a
+    retry here (e.g. DB hiccup) must not re-run it.
+
+    The two steps are independent (queue dispatch locks a different row and
+    never reads this claim), so they run concurrently. Each step records
+    completion in heartbeat details, which Temporal carries across retries,
+    so a retry never re-stores the result or starts a second queued claim.
+
+    Args:
+        chain_queue: False for child workflows (parent orchestrates the
+                     queue), which skips start_next_queued_claim.
+
+    Returns the next claim_id if a workflow was started, None otherwise.
+    """
+    import asyncio
+
+    details = activity.info().heartbeat_details
+    progress: dict = dict(details[0]) if details else {}
+
+    def _checkpoint(**done) -> None:
+        progress.update(done)
+        activity.heartbeat(dict(progress))
+
+    async def _store() -> None:
+        if progress.get("stored"):
+            return
+        await store_result(claim_id, result, thesis_info, atomic_facts)
+        _checkpoint(stored=True)
+
+    async def _dispatch_next() -> str | None:
+        if not chain_queue or "next_claim" in progress:
+            return progress.get("next_claim")
+        next_claim = await start_next_queued_claim()
+        _checkpoint(next_claim=next_claim)
+        return next_claim
+
+    if progress:
+        log.info(activity.logger, "finalize", "resume",
+                 "Resuming finalize after retry",
+                 claim_id=claim_id, stored=progress.get("stored", False),
+                 dispatched="next_claim" in progress)
+
+    # Let both finish before surfacing a failure, so the checkpoint of the
+    # step that succeeded is recorded before Temporal retries
+    stored, next_claim = await asyncio.gather(
+        _store(), _dispatch_next(), return_exceptions=True,
+    )
+    for outcome in (stored, next_claim):
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return next_claim
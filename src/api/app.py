@@ -5,15 +5,12 @@ Set LOG_FORMAT=pretty for development-friendly output.
 """
 
 import os
-import sys
 from contextlib import asynccontextmanager
 
-# Force unbuffered output so Docker/Promtail sees logs immediately
-sys.stdout = os.fdopen(sys.stdout.fileno(), "w", buffering=1)
-sys.stderr = os.fdopen(sys.stderr.fileno(), "w", buffering=1)
-
 # Configure structured logging BEFORE importing anything else
-from src.utils.logging import configure_logging, get_logger, log  # noqa: E402
+from src.utils.logging import (  # noqa: E402
+    configure_logging, get_logger, log, shutdown_logging,
+)
 
 configure_logging()
 
@@ -300,6 +297,7 @@ async def lifespan(app: FastAPI):
     # Cleanup
     await engine.dispose()
     log.info(logger, MODULE, "shutdown", "Application shutdown complete")
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -224,3 +224,18 @@ class WikidataCache(Base):
     relationships = Column(JSONB, nullable=True)  # Full get_ownership_chain() result
     scraped_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
 
+
+
+class DecompositionCache(Base):
+    """Cached decompose_claim results, shared across workers and restarts.
+
+    Keyed by sha256 of model + whitespace-normalized claim text + context
+    (speaker, date, transcript). Only successful LLM decompositions are
+    stored. TTL: 24 hours (DECOMPOSE_CACHE_TTL in verify_activities).
+    """
+    __tablename__ = "decomposition_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 hex digest
+    model = Column(String(128), nullable=False)  # LLM that produced the result
+    result = Column(JSONB, nullable=False)  # Full decompose_claim() return value
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
@@ -15,6 +15,7 @@ import httpx
 from langchain_core.tools import tool
 
 from src.tools.source_filter import filter_results, warm_mbfc_cache_background
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "tools"
@@ -46,62 +47,62 @@ async def search_brave(query: str, max_results: int = 5) -> list[dict]:
              query=query, max_results=max_results)
     _t0 = _time.monotonic()
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(
-                BRAVE_URL,
-                params={
-                    "q": query,
-                    "count": max_results,
-                    "text_decorations": False,
-                    "search_lang": "en",
-                },
-                headers={
-                    "Accept": "application/json",
-                    "Accept-Encoding": "gzip",
-                    "X-Subscription-Token": BRAVE_API_KEY,
-                },
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            results = []
-            for item in data.get("web", {}).get("results", [])[:max_results + 5]:
-                results.append({
-                    "title": item.get("title", ""),
-                    "snippet": item.get("description", ""),
-                    "url": item.get("url", ""),
-                })
-
-            raw_count = len(results)
-
-            await warm_mbfc_cache_background(results)
-            results = filter_results(results)[:max_results]
-
-            log.info(logger, MODULE, "brave_done", "Brave search complete",
-                     query=query, raw_count=raw_count, result_count=len(results),
-                     latency_ms=int((_time.monotonic() - _t0) * 1000))
-            return results
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code in (400, 401, 403, 422):
-                _disabled = True
-                log.warning(logger, MODULE, "brave_disabled",
-                            "Brave returned error, disabling for this process",
-                            error=str(e), status=e.response.status_code,
-                            query=query)
-            else:
-                log.warning(logger, MODULE, "brave_failed",
-                            "Brave search failed",
-                            error=str(e), error_type=type(e).__name__,
-                            query=query)
-            return []
-        except Exception as e:
-            log.warning(logger, MODULE, "brave_failed", "Brave search failed",
+    client = get_client()
+    try:
+        resp = await client.get(
+            BRAVE_URL,
+            params={
+                "q": query,
+                "count": max_results,
+                "text_decorations": False,
+                "search_lang": "en",
+            },
+            headers={
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip",
+                "X-Subscription-Token": BRAVE_API_KEY,
+            },
+            timeout=15,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        results = []
+        for item in data.get("web", {}).get("results", [])[:max_results + 5]:
+            results.append({
+                "title": item.get("title", ""),
+                "snippet": item.get("description", ""),
+                "url": item.get("url", ""),
+            })
+
+        raw_count = len(results)
+
+        await warm_mbfc_cache_background(results)
+        results = filter_results(results)[:max_results]
+
+        log.info(logger, MODULE, "brave_done", "Brave search complete",
+                 query=query, raw_count=raw_count, result_count=len(results),
+                 latency_ms=int((_time.monotonic() - _t0) * 1000))
+        return results
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (400, 401, 403, 422):
+            _disabled = True
+            log.warning(logger, MODULE, "brave_disabled",
+                        "Brave returned error, disabling for this process",
+                        error=str(e), status=e.response.status_code,
+                        query=query)
+        else:
+            log.warning(logger, MODULE, "brave_failed",
+                        "Brave search failed",
                         error=str(e), error_type=type(e).__name__,
                         query=query)
-            return []
+        return []
+    except Exception as e:
+        log.warning(logger, MODULE, "brave_failed", "Brave search failed",
+                    error=str(e), error_type=type(e).__name__,
+                    query=query)
+        return []
 
 
 def get_brave_tool():
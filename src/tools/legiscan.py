@@ -36,8 +36,7 @@ import os
 import re
 import time as _time
 
-import httpx
-
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "legiscan"
@@ -68,25 +67,25 @@ async def _legiscan_request(params: dict) -> dict | None:
     """
     params["key"] = LEGISCAN_API_KEY
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        try:
-            resp = await client.get(LEGISCAN_URL, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-
-            if data.get("status") == "ERROR":
-                log.warning(logger, MODULE, "api_error",
-                            "LegiScan API error",
-                            error=data.get("alert", {}).get("message", "unknown"))
-                return None
-
-            return data
-        except Exception as e:
-            log.warning(logger, MODULE, "request_failed",
-                        "LegiScan request failed",
-                        error=str(e), error_type=type(e).__name__)
+    client = get_client()
+    try:
+        resp = await client.get(LEGISCAN_URL, params=params, timeout=15.0)
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data.get("status") == "ERROR":
+            log.warning(logger, MODULE, "api_error",
+                        "LegiScan API error",
+                        error=data.get("alert", {}).get("message", "unknown"))
             return None
 
+        return data
+    except Exception as e:
+        log.warning(logger, MODULE, "request_failed",
+                    "LegiScan request failed",
+                    error=str(e), error_type=type(e).__name__)
+        return None
+
 
 async def search_bills(query: str, state: str = "US") -> list[dict]:
     """Search for bills matching a query.
@@ -13,6 +13,7 @@ import httpx
 from langchain_core.tools import tool
 
 from src.tools.source_filter import is_blocked
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "tools"
@@ -84,74 +85,73 @@ async def fetch_page(url: str) -> dict:
     log.info(logger, MODULE, "fetch_start", "Fetching page",
              url=url)
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=FETCH_TIMEOUT,
-    ) as client:
-        try:
-            resp = await client.get(
-                url,
-                headers={
-                    "User-Agent": USER_AGENT,
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                },
-            )
-            resp.raise_for_status()
-
-            content_type = resp.headers.get("content-type", "")
-            if "text/html" not in content_type and "application/xhtml" not in content_type:
-                return {
-                    "url": url,
-                    "title": "",
-                    "content": f"Non-HTML content type: {content_type}",
-                    "error": "not_html",
-                }
-
-            html = resp.text
-            text = _extract_text(html)
-
-            # Extract title
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "lxml")
-            title = soup.title.string.strip() if soup.title and soup.title.string else ""
-
-            # Truncate
-            if len(text) > MAX_CONTENT_LENGTH:
-                text = text[:MAX_CONTENT_LENGTH] + "\n\n[... content truncated ...]"
-
-            log.info(logger, MODULE, "fetch_done", "Page fetched",
-                     url=url, status_code=resp.status_code,
-                     content_length=len(text),
-                     latency_ms=int((_time.monotonic() - _t0) * 1000))
-
-            return {
-                "url": url,
-                "title": title,
-                "content": text,
-                "error": None,
-            }
-
-        except httpx.HTTPStatusError as e:
-            log.warning(logger, MODULE, "fetch_http_error", "Page fetch HTTP error",
-                        url=url, status_code=e.response.status_code)
+    client = get_client()
+    try:
+        resp = await client.get(
+            url,
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+            follow_redirects=True,
+            timeout=FETCH_TIMEOUT,
+        )
+        resp.raise_for_status()
+
+        content_type = resp.headers.get("content-type", "")
+        if "text/html" not in content_type and "application/xhtml" not in content_type:
             return {
                 "url": url,
                 "title": "",
-                "content": "",
-                "error": f"HTTP {e.response.status_code}",
+                "content": f"Non-HTML content type: {content_type}",
+                "error": "not_html",
             }
 
-        except Exception as e:
-            log.warning(logger, MODULE, "fetch_failed", "Page fetch failed",
-                        url=url, error=str(e),
-                        error_type=type(e).__name__)
-            return {
-                "url": url,
-                "title": "",
-                "content": "",
-                "error": str(e),
-            }
+        html = resp.text
+        text = _extract_text(html)
+
+        # Extract title
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, "lxml")
+        title = soup.title.string.strip() if soup.title and soup.title.string else ""
+
+        # Truncate
+        if len(text) > MAX_CONTENT_LENGTH:
+            text = text[:MAX_CONTENT_LENGTH] + "\n\n[... content truncated ...]"
+
+        log.info(logger, MODULE, "fetch_done", "Page fetched",
+                 url=url, status_code=resp.status_code,
+                 content_length=len(text),
+                 latency_ms=int((_time.monotonic() - _t0) * 1000))
+
+        return {
+            "url": url,
+            "title": title,
+            "content": text,
+            "error": None,
+        }
+
+    except httpx.HTTPStatusError as e:
+        log.warning(logger, MODULE, "fetch_http_error", "Page fetch HTTP error",
+                    url=url, status_code=e.response.status_code)
+        return {
+            "url": url,
+            "title": "",
+            "content": "",
+            "error": f"HTTP {e.response.status_code}",
+        }
+
+    except Exception as e:
+        log.warning(logger, MODULE, "fetch_failed", "Page fetch failed",
+                    url=url, error=str(e),
+                    error_type=type(e).__name__)
+        return {
+            "url": url,
+            "title": "",
+            "content": "",
+            "error": str(e),
+        }
 
 
 def get_page_fetcher_tool():
@@ -12,10 +12,10 @@ The SEARXNG_URL env var points to the container's JSON API endpoint.
 """
 
 import os
-import httpx
 from langchain_core.tools import tool
 
 from src.tools.source_filter import filter_results, warm_mbfc_cache_background
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "tools"
@@ -51,47 +51,47 @@ async def search_searxng(
              query=query, max_results=max_results, categories=categories)
     _t0 = _time.monotonic()
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(
-                f"{SEARXNG_URL}/search",
-                params={
-                    "q": query,
-                    "format": "json",
-                    "categories": categories,
-                    "language": "en",
-                    "pageno": 1,
-                },
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            results = []
-            for item in data.get("results", [])[:max_results + 5]:
-                results.append({
-                    "title": item.get("title", ""),
-                    "snippet": item.get("content", ""),
-                    "url": item.get("url", ""),
-                    "engines": item.get("engines", []),
-                })
-
-            raw_count = len(results)
-
-            # Pre-populate MBFC cache so filter_results has data for unknown domains
-            await warm_mbfc_cache_background(results)
-            results = filter_results(results)[:max_results]
-
-            log.info(logger, MODULE, "searxng_done", "SearXNG search complete",
-                     query=query, raw_count=raw_count, result_count=len(results),
-                     latency_ms=int((_time.monotonic() - _t0) * 1000))
-            return results
-
-        except Exception as e:
-            log.warning(logger, MODULE, "searxng_failed", "SearXNG search failed",
-                        error=str(e), error_type=type(e).__name__,
-                        query=query)
-            return []
+    client = get_client()
+    try:
+        resp = await client.get(
+            f"{SEARXNG_URL}/search",
+            params={
+                "q": query,
+                "format": "json",
+                "categories": categories,
+                "language": "en",
+                "pageno": 1,
+            },
+            timeout=15,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        results = []
+        for item in data.get("results", [])[:max_results + 5]:
+            results.append({
+                "title": item.get("title", ""),
+                "snippet": item.get("content", ""),
+                "url": item.get("url", ""),
+                "engines": item.get("engines", []),
+            })
+
+        raw_count = len(results)
+
+        # Pre-populate MBFC cache so filter_results has data for unknown domains
+        await warm_mbfc_cache_background(results)
+        results = filter_results(results)[:max_results]
+
+        log.info(logger, MODULE, "searxng_done", "SearXNG search complete",
+                 query=query, raw_count=raw_count, result_count=len(results),
+                 latency_ms=int((_time.monotonic() - _t0) * 1000))
+        return results
+
+    except Exception as e:
+        log.warning(logger, MODULE, "searxng_failed", "SearXNG search failed",
+                    error=str(e), error_type=type(e).__name__,
+                    query=query)
+        return []
 
 
 def get_searxng_tool():
@@ -13,6 +13,7 @@ import httpx
 from langchain_core.tools import tool
 
 from src.tools.source_filter import filter_results, warm_mbfc_cache_background
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "tools"
@@ -46,66 +47,66 @@ async def search_serper(query: str, max_results: int = 5) -> list[dict]:
              query=query, max_results=max_results)
     _t0 = _time.monotonic()
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.post(
-                SERPER_URL,
-                json={"q": query, "num": max_results},
-                headers={
-                    "X-API-KEY": SERPER_API_KEY,
-                    "Content-Type": "application/json",
-                },
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            results = []
-
-            # Organic results (main search results)
-            for item in data.get("organic", [])[:max_results + 5]:
-                results.append({
-                    "title": item.get("title", ""),
-                    "snippet": item.get("snippet", ""),
-                    "url": item.get("link", ""),
-                })
-
-            # Knowledge graph (if present — often has authoritative info)
-            kg = data.get("knowledgeGraph", {})
-            if kg and kg.get("description"):
-                results.append({
-                    "title": kg.get("title", "Knowledge Graph"),
-                    "snippet": kg.get("description", ""),
-                    "url": kg.get("descriptionLink") or kg.get("website") or "",
-                })
-
-            raw_count = len(results)
-
-            await warm_mbfc_cache_background(results)
-            results = filter_results(results)[:max_results]
-
-            log.info(logger, MODULE, "serper_done", "Serper search complete",
-                     query=query, raw_count=raw_count, result_count=len(results),
-                     latency_ms=int((_time.monotonic() - _t0) * 1000))
-            return results
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                _disabled = True
-                log.warning(logger, MODULE, "serper_disabled",
-                            "Serper returned 400, disabling for this process",
-                            error=str(e), query=query)
-            else:
-                log.warning(logger, MODULE, "serper_failed",
-                            "Serper search failed",
-                            error=str(e), error_type=type(e).__name__,
-                            query=query)
-            return []
-        except Exception as e:
-            log.warning(logger, MODULE, "serper_failed", "Serper search failed",
+    client = get_client()
+    try:
+        resp = await client.post(
+            SERPER_URL,
+            json={"q": query, "num": max_results},
+            headers={
+                "X-API-KEY": SERPER_API_KEY,
+                "Content-Type": "application/json",
+            },
+            timeout=15,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        results = []
+
+        # Organic results (main search results)
+        for item in data.get("organic", [])[:max_results + 5]:
+            results.append({
+                "title": item.get("title", ""),
+                "snippet": item.get("snippet", ""),
+                "url": item.get("link", ""),
+            })
+
+        # Knowledge graph (if present — often has authoritative info)
+        kg = data.get("knowledgeGraph", {})
+        if kg and kg.get("description"):
+            results.append({
+                "title": kg.get("title", "Knowledge Graph"),
+                "snippet": kg.get("description", ""),
+                "url": kg.get("descriptionLink") or kg.get("website") or "",
+            })
+
+        raw_count = len(results)
+
+        await warm_mbfc_cache_background(results)
+        results = filter_results(results)[:max_results]
+
+        log.info(logger, MODULE, "serper_done", "Serper search complete",
+                 query=query, raw_count=raw_count, result_count=len(results),
+                 latency_ms=int((_time.monotonic() - _t0) * 1000))
+        return results
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400:
+            _disabled = True
+            log.warning(logger, MODULE, "serper_disabled",
+                        "Serper returned 400, disabling for this process",
+                        error=str(e), query=query)
+        else:
+            log.warning(logger, MODULE, "serper_failed",
+                        "Serper search failed",
                         error=str(e), error_type=type(e).__name__,
                         query=query)
-            return []
+        return []
+    except Exception as e:
+        log.warning(logger, MODULE, "serper_failed", "Serper search failed",
+                    error=str(e), error_type=type(e).__name__,
+                    query=query)
+        return []
 
 
 def get_serper_tool():
@@ -24,12 +24,12 @@ from datetime import datetime, timezone, timedelta
 from urllib.parse import urlparse
 from typing import Optional
 
-import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy import select
 
 from src.db.session import get_sync_session
 from src.db.models import SourceRating
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "source_ratings"
@@ -289,18 +289,19 @@ async def _lazy_scrape_ownership(domain: str) -> None:
             return
 
     try:
-        async with httpx.AsyncClient(
+        client = get_client()
+        resp = await client.get(
+            mbfc_url,
             timeout=15.0,
             follow_redirects=True,
             headers={"User-Agent": "SpinCycle/1.0 (news verification)"},
-        ) as client:
-            resp = await client.get(mbfc_url)
-            if resp.status_code != 200:
-                log.warning(logger, MODULE, "lazy_scrape_failed",
-                            "Ownership scrape HTTP error",
-                            domain=domain, status=resp.status_code)
-                return
-            parsed = _parse_mbfc_page(resp.text, mbfc_url)
+        )
+        if resp.status_code != 200:
+            log.warning(logger, MODULE, "lazy_scrape_failed",
+                        "Ownership scrape HTTP error",
+                        domain=domain, status=resp.status_code)
+            return
+        parsed = _parse_mbfc_page(resp.text, mbfc_url)
     except Exception as e:
         log.warning(logger, MODULE, "lazy_scrape_error",
                     "Ownership scrape failed", domain=domain, error=str(e))
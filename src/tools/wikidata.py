@@ -20,7 +20,6 @@ Caching:
 - Cache hit = instant, cache miss = API query + store
 """
 
-import httpx
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from urllib.parse import quote
@@ -30,6 +29,7 @@ from sqlalchemy.dialects.postgresql import insert
 
 from src.db.session import get_sync_session
 from src.db.models import WikidataCache
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "wikidata"
@@ -177,27 +177,28 @@ async def search_entity(name: str) -> Optional[str]:
     }
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                WIKIDATA_SEARCH,
-                params=params,
-                headers={"User-Agent": USER_AGENT}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = get_client()
+        resp = await client.get(
+            WIKIDATA_SEARCH,
+            params=params,
+            headers={"User-Agent": USER_AGENT},
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
             
-            results = data.get("search", [])
-            if results:
-                qid = results[0].get("id")
-                _entity_cache[name] = qid
-                _entity_cache[clean_name] = qid
-                log.debug(logger, MODULE, "entity_found",
-                         "Wikidata entity resolved", entity=clean_name, qid=qid)
-                return qid
-
-            _entity_cache[name] = None
-            _entity_cache[clean_name] = None
-            return None
+        results = data.get("search", [])
+        if results:
+            qid = results[0].get("id")
+            _entity_cache[name] = qid
+            _entity_cache[clean_name] = qid
+            log.debug(logger, MODULE, "entity_found",
+                     "Wikidata entity resolved", entity=clean_name, qid=qid)
+            return qid
+
+        _entity_cache[name] = None
+        _entity_cache[clean_name] = None
+        return None
             
     except Exception as e:
         log.warning(logger, MODULE, "search_failed",
@@ -223,20 +224,21 @@ async def get_entity_description(name: str) -> str | None:
         "limit": 1,
     }
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                WIKIDATA_SEARCH, params=params,
-                headers={"User-Agent": USER_AGENT},
-            )
-            resp.raise_for_status()
-            results = resp.json().get("search", [])
-            if results and results[0].get("description"):
-                desc = results[0]["description"]
-                log.debug(logger, MODULE, "description_found",
-                          "Wikidata description resolved",
-                          entity=clean_name, description=desc)
-                return desc
-            return None
+        client = get_client()
+        resp = await client.get(
+            WIKIDATA_SEARCH, params=params,
+            headers={"User-Agent": USER_AGENT},
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        results = resp.json().get("search", [])
+        if results and results[0].get("description"):
+            desc = results[0]["description"]
+            log.debug(logger, MODULE, "description_found",
+                      "Wikidata description resolved",
+                      entity=clean_name, description=desc)
+            return desc
+        return None
     except Exception as e:
         log.warning(logger, MODULE, "description_failed",
                     "Wikidata description lookup failed",
@@ -264,23 +266,24 @@ async def get_entity_aliases(qid: str) -> list[str]:
         "format": "json",
     }
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                WIKIDATA_SEARCH,
-                params=params,
-                headers={"User-Agent": USER_AGENT},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            entity_data = data.get("entities", {}).get(qid, {})
-            alias_entries = entity_data.get("aliases", {}).get("en", [])
-            aliases = [a["value"] for a in alias_entries if a.get("value")]
-
-            log.debug(logger, MODULE, "aliases_found",
-                      "Wikidata aliases resolved",
-                      entity=qid, alias_count=len(aliases))
-            return aliases
+        client = get_client()
+        resp = await client.get(
+            WIKIDATA_SEARCH,
+            params=params,
+            headers={"User-Agent": USER_AGENT},
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        entity_data = data.get("entities", {}).get(qid, {})
+        alias_entries = entity_data.get("aliases", {}).get("en", [])
+        aliases = [a["value"] for a in alias_entries if a.get("value")]
+
+        log.debug(logger, MODULE, "aliases_found",
+                  "Wikidata aliases resolved",
+                  entity=qid, alias_count=len(aliases))
+        return aliases
     except Exception as e:
         log.warning(logger, MODULE, "aliases_failed",
                     "Wikidata alias lookup failed",
@@ -308,33 +311,34 @@ async def get_entity_relationships(qid: str) -> dict:
     """
     
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                WIKIDATA_SPARQL,
-                params={"query": query, "format": "json"},
-                headers={"User-Agent": USER_AGENT}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = get_client()
+        resp = await client.get(
+            WIKIDATA_SPARQL,
+            params={"query": query, "format": "json"},
+            headers={"User-Agent": USER_AGENT},
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
             
-            results = {}
-            for binding in data.get("results", {}).get("bindings", []):
-                prop_uri = binding.get("prop", {}).get("value", "")
-                prop_id = prop_uri.split("/")[-1] if prop_uri else None
+        results = {}
+        for binding in data.get("results", {}).get("bindings", []):
+            prop_uri = binding.get("prop", {}).get("value", "")
+            prop_id = prop_uri.split("/")[-1] if prop_uri else None
                 
-                value_label = binding.get("valueLabel", {}).get("value", "")
-                value_qid = binding.get("value", {}).get("value", "").split("/")[-1]
+            value_label = binding.get("valueLabel", {}).get("value", "")
+            value_qid = binding.get("value", {}).get("value", "").split("/")[-1]
                 
-                if prop_id and prop_id in PROPERTIES:
-                    prop_name = PROPERTIES[prop_id]
-                    if prop_name not in results:
-                        results[prop_name] = []
-                    results[prop_name].append({
-                        "name": value_label,
-                        "qid": value_qid,
-                    })
+            if prop_id and prop_id in PROPERTIES:
+                prop_name = PROPERTIES[prop_id]
+                if prop_name not in results:
+                    results[prop_name] = []
+                results[prop_name].append({
+                    "name": value_label,
+                    "qid": value_qid,
+                })
             
-            return results
+        return results
             
     except Exception as e:
         log.warning(logger, MODULE, "sparql_failed",
@@ -369,22 +373,23 @@ async def get_media_owned_by(person_or_org: str) -> list[str]:
     """
     
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                WIKIDATA_SPARQL,
-                params={"query": query, "format": "json"},
-                headers={"User-Agent": USER_AGENT}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = get_client()
+        resp = await client.get(
+            WIKIDATA_SPARQL,
+            params={"query": query, "format": "json"},
+            headers={"User-Agent": USER_AGENT},
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
             
-            media = []
-            for binding in data.get("results", {}).get("bindings", []):
-                label = binding.get("mediaLabel", {}).get("value", "")
-                if label:
-                    media.append(label)
+        media = []
+        for binding in data.get("results", {}).get("bindings", []):
+            label = binding.get("mediaLabel", {}).get("value", "")
+            if label:
+                media.append(label)
             
-            return media
+        return media
             
     except Exception as e:
         log.warning(logger, MODULE, "media_query_failed",
@@ -10,9 +10,9 @@ raw function returns dicts (for programmatic use).
 
 import re
 
-import httpx
 from langchain_core.tools import tool
 
+from src.utils.http_client import get_client
 from src.utils.logging import log, get_logger
 
 MODULE = "tools"
@@ -27,38 +27,38 @@ async def search_wikipedia(query: str, max_results: int = 3) -> list[dict]:
     log.info(logger, MODULE, "wiki_search_start", "Wikipedia search starting",
              query=query, max_results=max_results)
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://en.wikipedia.org/w/api.php",
-            params={
-                "action": "query",
-                "list": "search",
-                "srsearch": query,
-                "srlimit": max_results,
-                "format": "json",
-            },
-            headers={
-                "User-Agent": "SpinCycle/0.1 (claim verification research tool)",
-            },
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for item in data.get("query", {}).get("search", []):
-            snippet = item.get("snippet", "")
-            # Wikipedia search API returns HTML-highlighted snippets — strip tags
-            snippet = re.sub(r"<[^>]+>", "", snippet)
-            results.append({
-                "title": item["title"],
-                "summary": snippet,
-                "url": f"https://en.wikipedia.org/wiki/{item['title'].replace(' ', '_')}",
-            })
-
-        log.info(logger, MODULE, "wiki_search_done", "Wikipedia search complete",
-                 query=query, result_count=len(results))
-        return results
+    client = get_client()
+    resp = await client.get(
+        "https://en.wikipedia.org/w/api.php",
+        params={
+            "action": "query",
+            "list": "search",
+            "srsearch": query,
+            "srlimit": max_results,
+            "format": "json",
+        },
+        headers={
+            "User-Agent": "SpinCycle/0.1 (claim verification research tool)",
+        },
+        timeout=10,
+    )
+    resp.raise_for_status()
+    data = resp.json()
+
+    results = []
+    for item in data.get("query", {}).get("search", []):
+        snippet = item.get("snippet", "")
+        # Wikipedia search API returns HTML-highlighted snippets — strip tags
+        snippet = re.sub(r"<[^>]+>", "", snippet)
+        results.append({
+            "title": item["title"],
+            "summary": snippet,
+            "url": f"https://en.wikipedia.org/wiki/{item['title'].replace(' ', '_')}",
+        })
+
+    log.info(logger, MODULE, "wiki_search_done", "Wikipedia search complete",
+             query=query, result_count=len(results))
+    return results
 
 
 def get_wikipedia_tool():
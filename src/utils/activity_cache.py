@@ -0,0 +1,110 @@
+"""In-process, content-addressed cache for expensive activity results.
+
+Activities like decompose/research/judge are dominated by LLM time. When
+the exact same inputs come through again — a Temporal retry after the
+result was computed but not delivered, the same claim re-submitted, the
+same fact appearing in several transcript claims — the cached result is
+returned instead of re-running the LLM pipeline.
+
+Keys are sha256 over the activity name + JSON-serialized arguments, so
+any change in inputs (evidence, parties, dates) is a miss. Entries expire
+after a TTL and the cache is LRU-bounded per activity.
+
+Entries are deep-copied on store and on hit, so callers mutating a result
+(e.g. rank_and_select annotating evidence dicts) never alter the cached
+copy or the keys of later lookups built from it.
+
+The cache is per worker process (no Redis in this stack). Results are
+only cached on success — failures always re-run. Activities that degrade
+instead of raising (e.g. an LLM-failure fallback) pass should_cache to
+keep those results out too.
+
+USAGE
+=====
+@activity.defn
+@cached(ttl_seconds=24 * 3600)
+async def decompose_claim(claim_text: str, ...) -> dict:
+    ...
+
+@activity.defn goes OUTERMOST — functools.wraps keeps the signature and
+type hints Temporal uses for argument conversion.
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from src.utils.logging import log, get_logger
+
+MODULE = "cache"
+logger = get_logger()
+
+DEFAULT_MAXSIZE = 256
+
+
+def content_key(*parts: Any) -> str:
+    """sha256 over the JSON-serialized parts — for custom cache keys."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _default_key(name: str, args: tuple, kwargs: dict) -> str:
+    """Content key over the activity name and its arguments."""
+    return content_key(name, args, kwargs)
+
+
+def cached(
+    ttl_seconds: float,
+    maxsize: int = DEFAULT_MAXSIZE,
+    key: Optional[Callable[..., str]] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Cache an async function's results by content hash of its arguments.
+
+    Args:
+        ttl_seconds: How long a result stays valid.
+        maxsize: Max entries kept (least recently used evicted first).
+        key: Optional function (*args, **kwargs) -> str overriding the
+             default argument hash, e.g. to normalize text before hashing.
+        should_cache: Optional predicate on the result; False leaves it
+             uncached (degraded results the next call should retry).
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        name = fn.__name__
+        entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else _default_key(name, args, kwargs)
+            now = time.monotonic()
+
+            hit = entries.get(cache_key)
+            if hit is not None:
+                expires_at, value = hit
+                if expires_at > now:
+                    entries.move_to_end(cache_key)
+                    log.info(logger, MODULE, "hit", "Returning cached activity result",
+                             activity=name, key=cache_key[:12])
+                    return copy.deepcopy(value)
+                del entries[cache_key]
+
+            value = await fn(*args, **kwargs)
+            if should_cache is not None and not should_cache(value):
+                log.debug(logger, MODULE, "skip", "Not caching degraded result",
+                          activity=name)
+                return value
+
+            entries[cache_key] = (now + ttl_seconds, copy.deepcopy(value))
+            entries.move_to_end(cache_key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
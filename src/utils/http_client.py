@@ -0,0 +1,85 @@
+"""Shared connection pool for tools and activities.
+
+Research fires dozens of requests per fact (search APIs, Wikidata, page
+fetches, MBFC scrapes). Opening a fresh httpx.AsyncClient per call pays
+TCP + TLS setup every time and throws the connection away. One pooled
+transport per event loop keeps connections to the same hosts alive across
+tool calls and activities.
+
+get_client() returns a new, cheap AsyncClient over that shared transport,
+so each call still gets its own short-lived cookie jar — cookies persist
+across one call's redirects (consent walls, paywall bounces) but never
+leak between unrelated tools. Per-request options (timeout, headers,
+follow_redirects) are passed to the request itself.
+
+USAGE
+=====
+from src.utils.http_client import get_client
+
+resp = await get_client().get(url, params=..., timeout=10)
+
+Don't close the returned client — that would close the shared pool. The
+worker calls close_client() on shutdown.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+from src.utils.logging import log, get_logger
+
+MODULE = "http"
+logger = get_logger()
+
+LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+
+_transport: Optional[httpx.AsyncHTTPTransport] = None
+_transport_loop: Optional[asyncio.AbstractEventLoop] = None
+_closing: set[asyncio.Task] = set()
+
+
+async def _close_stale(transport: httpx.AsyncHTTPTransport) -> None:
+    """Close a pool left behind by a previous event loop."""
+    try:
+        await transport.aclose()
+    except Exception as e:
+        # Connections bound to a dead loop can fail to close cleanly
+        log.debug(logger, MODULE, "stale_close_failed",
+                  "Could not cleanly close stale HTTP pool", error=str(e))
+
+
+def _get_transport() -> httpx.AsyncHTTPTransport:
+    """Return the pooled transport for the running event loop.
+
+    Pooled connections are bound to the loop that opened them, so a new
+    transport is created if the loop changed (e.g. scripts calling
+    asyncio.run() more than once). The old one is closed first.
+    """
+    global _transport, _transport_loop
+    loop = asyncio.get_running_loop()
+    if _transport is not None and _transport_loop is not loop:
+        task = loop.create_task(_close_stale(_transport))
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+        _transport = None
+    if _transport is None:
+        _transport = httpx.AsyncHTTPTransport(limits=LIMITS)
+        _transport_loop = loop
+        log.debug(logger, MODULE, "pool_created", "Created shared HTTP pool")
+    return _transport
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return a per-call client (own cookie jar) over the shared pool."""
+    return httpx.AsyncClient(transport=_get_transport(), timeout=DEFAULT_TIMEOUT)
+
+
+async def close_client() -> None:
+    """Close the shared pool (worker shutdown)."""
+    global _transport, _transport_loop
+    if _transport is not None:
+        await _transport.aclose()
+    _transport = None
+    _transport_loop = None
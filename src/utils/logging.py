@@ -42,6 +42,10 @@ log.error(activity.logger, "judge", "parse_failed", "Failed to parse verdict",
 log.info(workflow.logger, "workflow", "started", "Verification started",
          claim_id=claim_id, sub_claims=3)
 
+# Bind module + context once when many calls share them (e.g. a workflow run):
+wlog = log.bind(workflow.logger, "workflow", claim_id=claim_id)
+wlog.info("decomposed", "Claim decomposed", fact_count=3)
+
 # In infrastructure code (no activity/workflow context):
 logger = get_logger()
 log.info(logger, "worker", "ready", "Worker listening", task_queue="spin-cycle-verify")
@@ -56,14 +60,23 @@ Consistent suffixes for queryable actions:
   *_fallback  — falling back to alternative path
 """
 
+import atexit
+import copy
+import functools
 import json
 import logging
 import os
+import queue
 import re
 import sys
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# Bound once so the per-record timestamp path avoids global/attribute lookups
+_UTC = timezone.utc
+_fromtimestamp = datetime.fromtimestamp
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for Grafana Loki. Strips Temporal context dicts."""
@@ -73,42 +86,67 @@ class StructuredFormatter(logging.Formatter):
     def __init__(self, pretty: bool = False):
         super().__init__()
         self.pretty = pretty
-
-    def format(self, record: logging.LogRecord) -> str:
+        # Output mode is fixed at startup — bind the implementation once
+        # instead of branching on self.pretty for every record
+        self.format = self._format_pretty if pretty else self._format_json
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _strip_temporal_ctx(msg: str) -> str:
+        """Regex-strip the context dict; cached since Temporal repeats messages on retries."""
+        return StructuredFormatter.TEMPORAL_CONTEXT.sub("", msg)
+
+    def _message(self, record: logging.LogRecord) -> str:
+        """Rendered message with the Temporal context dict stripped."""
         msg = record.getMessage()
-        msg = self.TEMPORAL_CONTEXT.sub("", msg)
+        if "({'" in msg:
+            return self._strip_temporal_ctx(msg)
+        return msg
+
+    @staticmethod
+    def _timestamp(record: logging.LogRecord) -> str:
+        """ISO-8601 UTC timestamp with millisecond precision."""
+        # isoformat() is cheaper than strftime(); drop the "+00:00" suffix
+        return _fromtimestamp(record.created, _UTC).isoformat(timespec="milliseconds")[:-6] + "Z"
+
+    def _structured_data(self, record: logging.LogRecord, msg: str) -> dict:
+        """Build the output fields for a record emitted via StructuredLogger."""
+        data = {
+            "ts": self._timestamp(record),
+            "level": record.levelname,
+            "module": record._module,
+            "action": record._action,
+            "msg": msg,
+        }
+        # _log already dropped None values — merge in one C-level call
+        data.update(record._extra)
+        return data
+
+    def _format_json(self, record: logging.LogRecord) -> str:
+        """One JSON object per line for Promtail/Loki."""
+        msg = self._message(record)
 
         # Structured log (emitted via StructuredLogger)
-        if hasattr(record, "_structured") and record._structured:
+        # extra= fields land directly in record.__dict__
+        if record.__dict__.get("_structured"):
+            data = self._structured_data(record, msg)
+        else:
+            # Legacy/third-party log — wrap in JSON so Promtail can still parse it
             data = {
-                "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
-                "level": record.levelname,
-                "module": record._module,
-                "action": record._action,
-                "msg": msg,
-            }
-            for key, value in record._extra.items():
-                if value is not None:
-                    data[key] = value
-
-            if self.pretty:
-                return self._pretty(data)
-            return json.dumps(data, default=str, separators=(",", ":"))
-
-        # Legacy/third-party log — wrap in JSON so Promtail can still parse it
-        if self.pretty:
-            return msg
-        return json.dumps(
-            {
-                "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+                "ts": self._timestamp(record),
                 "level": record.levelname,
                 "module": "legacy",
                 "action": "log",
                 "msg": msg,
-            },
-            default=str,
-            separators=(",", ":"),
-        )
+            }
+        return json.dumps(data, default=str, separators=(",", ":"))
+
+    def _format_pretty(self, record: logging.LogRecord) -> str:
+        """Human-readable line for development; legacy logs pass through."""
+        msg = self._message(record)
+        if record.__dict__.get("_structured"):
+            return self._pretty(self._structured_data(record, msg))
+        return msg
 
     def _pretty(self, data: dict) -> str:
         """Human-readable format for development."""
@@ -142,12 +180,22 @@ class StructuredLogger:
         msg: str,
         **kwargs,
     ) -> None:
-        """Emit a structured log."""
+        """Emit a structured log.
+
+        Bails out before building the extra dict when the logger would drop
+        the record anyway (e.g. DEBUG on an INFO logger, or Temporal replay).
+        """
+        if not logger.isEnabledFor(level):
+            return
+        # Drop None fields here, once, so the formatter can merge _extra
+        # without a per-key loop. Most calls have none and skip the copy.
+        if any(v is None for v in kwargs.values()):
+            kwargs = {k: v for k, v in kwargs.items() if v is not None}
         extra = {
             "_structured": True,
             "_module": module,
             "_action": action,
-            "_extra": {k: v for k, v in kwargs.items() if v is not None},
+            "_extra": kwargs,
         }
         logger.log(level, msg, extra=extra)
 
@@ -200,46 +248,157 @@ class StructuredLogger:
         """Log DEBUG level."""
         self._log(logger, logging.DEBUG, module, action, msg, **kwargs)
 
+    def bind(
+        self,
+        logger: logging.Logger,
+        module: str,
+        **context,
+    ) -> "BoundLogger":
+        """Capture logger, module and context fields for repeated calls."""
+        return BoundLogger(self, logger, module, context)
+
+
+class BoundLogger:
+    """
+    StructuredLogger with the logger, module and context fields bound.
+
+    Created via log.bind(). Methods take only action, message and per-call
+    fields; bound fields are merged in, per-call fields win on conflict.
+    """
+
+    __slots__ = ("_structured", "_logger", "_module", "_context")
+
+    def __init__(
+        self,
+        structured: StructuredLogger,
+        logger: logging.Logger,
+        module: str,
+        context: dict,
+    ):
+        self._structured = structured
+        self._logger = logger
+        self._module = module
+        self._context = context
+
+    def info(self, action: str, msg: str, **kwargs) -> None:
+        """Log INFO level."""
+        self._structured._log(self._logger, logging.INFO, self._module,
+                              action, msg, **{**self._context, **kwargs})
+
+    def warning(self, action: str, msg: str, **kwargs) -> None:
+        """Log WARNING level."""
+        self._structured._log(self._logger, logging.WARNING, self._module,
+                              action, msg, **{**self._context, **kwargs})
+
+    def error(
+        self,
+        action: str,
+        msg: str,
+        error: Optional[str] = None,
+        error_type: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Log ERROR level."""
+        self._structured._log(self._logger, logging.ERROR, self._module,
+                              action, msg, **{**self._context, **kwargs,
+                                              "error": error,
+                                              "error_type": error_type})
+
+    def debug(self, action: str, msg: str, **kwargs) -> None:
+        """Log DEBUG level."""
+        self._structured._log(self._logger, logging.DEBUG, self._module,
+                              action, msg, **{**self._context, **kwargs})
+
 
 # Singleton instance — import this everywhere
 log = StructuredLogger()
 
 # Fallback logger for infrastructure code that doesn't have
 # access to activity.logger or workflow.logger
-_fallback_logger = None
+_fallback_logger = logging.getLogger("spin-cycle.infra")
 
 
 def get_logger() -> logging.Logger:
     """Get a fallback logger for infrastructure code."""
-    global _fallback_logger
-    if _fallback_logger is None:
-        _fallback_logger = logging.getLogger("spin-cycle.infra")
     return _fallback_logger
 
 
+class _EnqueueHandler(QueueHandler):
+    """QueueHandler that hands records to the listener unformatted.
+
+    The stock prepare() runs a Formatter on the calling thread and appends
+    tracebacks to the message, which would break TEMPORAL_CONTEXT stripping.
+    Only the %-args are resolved here; StructuredFormatter does the rest.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+
+# Background thread that formats and writes queued records to stdout
+_listener: Optional[QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread.
+
+    Registered with atexit, but atexit doesn't run when the process is
+    killed by an unhandled signal (e.g. SIGTERM from docker stop), so
+    entrypoints also call this explicitly on shutdown.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_logging() -> None:
     """Configure root logger with structured formatter. Call once at startup.
 
+    Log calls only enqueue the record (QueueHandler); formatting and the
+    stdout write happen on a QueueListener thread so the worker's event
+    loop never blocks on I/O. Queued records are flushed by
+    shutdown_logging() (also registered with atexit).
+
     Reads from environment:
       LOG_FORMAT: "json" (default, for Loki) or "pretty" (for development)
       LOG_LEVEL: "INFO" (default), "DEBUG", "WARNING", "ERROR"
     """
+    global _listener
     pretty = os.environ.get("LOG_FORMAT", "json") == "pretty"
     level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
 
     handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(level)  # drop below-level records before format()
     handler.setFormatter(StructuredFormatter(pretty=pretty))
 
+    # Reconfiguring replaces the previous listener rather than stacking them
+    shutdown_logging()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+    queue_handler = _EnqueueHandler(log_queue)
+    queue_handler.setLevel(level)
+
     logging.basicConfig(
         level=level,
-        handlers=[handler],
+        handlers=[queue_handler],
         force=True,
     )
 
-    # Temporal loggers — keep activity/workflow at INFO, silence the chatty ones
-    logging.getLogger("temporalio.activity").setLevel(logging.INFO)
-    logging.getLogger("temporalio.workflow").setLevel(logging.INFO)
+    # Temporal loggers — activity/workflow follow LOG_LEVEL (our own log
+    # calls go through them, DEBUG lines included), silence the chatty ones
+    logging.getLogger("temporalio.activity").setLevel(level)
+    logging.getLogger("temporalio.workflow").setLevel(level)
     logging.getLogger("temporalio.worker").setLevel(logging.WARNING)
     logging.getLogger("temporalio.client").setLevel(logging.WARNING)
     logging.getLogger("temporalio.service").setLevel(logging.WARNING)
@@ -9,14 +9,12 @@ Set LOG_FORMAT=pretty for development-friendly output.
 
 import asyncio
 import os
-import sys
-
-# Force unbuffered output so Docker/Promtail sees logs immediately
-sys.stdout = os.fdopen(sys.stdout.fileno(), "w", buffering=1)
-sys.stderr = os.fdopen(sys.stderr.fileno(), "w", buffering=1)
+import signal
 
 # Configure structured logging BEFORE importing temporalio
-from src.utils.logging import configure_logging, get_logger, log  # noqa: E402
+from src.utils.logging import (  # noqa: E402
+    configure_logging, get_logger, log, shutdown_logging,
+)
 
 configure_logging()
 
@@ -26,6 +24,7 @@ logger = get_logger()
 from temporalio.client import Client  # noqa: E402
 from temporalio.worker import Worker  # noqa: E402
 
+from src.utils.http_client import close_client  # noqa: E402
 from src.workflows.verify import VerifyClaimWorkflow  # noqa: E402
 from src.workflows.extract_transcript import ExtractTranscriptWorkflow  # noqa: E402
 from src.activities.verify_activities import (  # noqa: E402
@@ -33,9 +32,11 @@ from src.activities.verify_activities import (  # noqa: E402
     decompose_claim,
     research_subclaim,
     judge_subclaim,
+    research_and_judge,
     synthesize_verdict,
     store_result,
     start_next_queued_claim,
+    finalize_claim,
 )
 from src.activities.transcript_activities import (  # noqa: E402
     fetch_transcript,
@@ -52,6 +53,32 @@ from src.activities.transcript_activities import (  # noqa: E402
 TASK_QUEUE = "spin-cycle-verify"
 TEMPORAL_HOST = os.getenv("TEMPORAL_HOST", "localhost:7233")
 
+WORKFLOWS = [VerifyClaimWorkflow, ExtractTranscriptWorkflow]
+
+ACTIVITIES = [
+    # Verification pipeline
+    create_claim,
+    decompose_claim,
+    research_subclaim,
+    judge_subclaim,
+    research_and_judge,
+    synthesize_verdict,
+    store_result,
+    start_next_queued_claim,
+    finalize_claim,
+    # Transcript extraction
+    fetch_transcript,
+    extract_transcript_batch,
+    finalize_extraction,
+    store_transcript,
+    store_transcript_claims,
+    create_claims_for_transcript,
+    update_transcript_status,
+    finish_transcript_and_start_next,
+    # Frontend notification
+    notify_frontend_refresh,
+]
+
 
 async def main():
     log.info(logger, MODULE, "starting", "Connecting to Temporal",
@@ -71,40 +98,31 @@ async def main():
     worker = Worker(
         client,
         task_queue=TASK_QUEUE,
-        workflows=[VerifyClaimWorkflow, ExtractTranscriptWorkflow],
-        activities=[
-            # Verification pipeline
-            create_claim,
-            decompose_claim,
-            research_subclaim,
-            judge_subclaim,
-            synthesize_verdict,
-            store_result,
-            start_next_queued_claim,
-            # Transcript extraction
-            fetch_transcript,
-            extract_transcript_batch,
-            finalize_extraction,
-            store_transcript,
-            store_transcript_claims,
-            create_claims_for_transcript,
-            update_transcript_status,
-            finish_transcript_and_start_next,
-            # Frontend notification
-            notify_frontend_refresh,
-        ],
+        workflows=WORKFLOWS,
+        activities=ACTIVITIES,
         # Match MAX_CONCURRENT=2 in the workflow — 2 LLM inference slots
         # with 65K context each (2 slots x 65K = 131072 total ctx).
         max_concurrent_activities=2,
     )
 
     log.info(logger, MODULE, "ready", "Worker listening",
-             task_queue=TASK_QUEUE, activity_count=15, workflow_count=2)
-    await worker.run()
+             task_queue=TASK_QUEUE, activity_count=len(ACTIVITIES),
+             workflow_count=len(WORKFLOWS))
+    # docker stop sends SIGTERM — shut the worker down gracefully so the
+    # finally below runs (atexit alone never fires on an unhandled signal)
+    asyncio.get_running_loop().add_signal_handler(
+        signal.SIGTERM, lambda: asyncio.ensure_future(worker.shutdown()),
+    )
+    try:
+        await worker.run()
+    finally:
+        await close_client()
+        log.info(logger, MODULE, "stopped", "Worker stopped")
+        shutdown_logging()
 
 
 if __name__ == "__main__":
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        log.info(logger, MODULE, "stopped", "Worker stopped by keyboard interrupt")
+        pass  # main() already logged the stop and flushed the log queue
@@ -43,6 +43,23 @@ SA_PHASE = SearchAttributeKey.for_keyword("Phase")
 SA_CLAIM_COUNT = SearchAttributeKey.for_int("ClaimCount")
 SA_TRANSCRIPT_TITLE = SearchAttributeKey.for_keyword("TranscriptTitle")
 
+# Retry policies and activity timeouts — built once per worker rather than
+# on every run (and every replay)
+ACTIVITY_RETRY = RetryPolicy(maximum_attempts=3)
+SHORT_RETRY = RetryPolicy(maximum_attempts=2)
+NOTIFY_RETRY = RetryPolicy(maximum_attempts=1)
+
+FETCH_TIMEOUT = timedelta(seconds=60)
+STORE_TRANSCRIPT_TIMEOUT = timedelta(seconds=60)
+# Structured output for 30-40 segments can take 15-25 min on local LLM
+EXTRACT_BATCH_TIMEOUT = timedelta(seconds=1800)
+FINALIZE_TIMEOUT = timedelta(seconds=30)
+STORE_CLAIMS_TIMEOUT = timedelta(seconds=15)
+CREATE_CLAIMS_TIMEOUT = timedelta(seconds=30)
+STATUS_TIMEOUT = timedelta(seconds=15)
+FINISH_TRANSCRIPT_TIMEOUT = timedelta(seconds=30)
+NOTIFY_TIMEOUT = timedelta(seconds=10)
+
 
 @workflow.defn
 class ExtractTranscriptWorkflow:
@@ -110,10 +127,10 @@ class ExtractTranscriptWorkflow:
             Dict with transcript metadata and extracted claims.
         """
         self._url = url
+        tlog = log.bind(workflow.logger, MODULE)
 
-        log.info(workflow.logger, MODULE, "started",
-                 "Starting transcript extraction",
-                 url=url)
+        # Full URL logged once here; later lines carry transcript_id instead
+        tlog.info("started", "Starting transcript extraction", url=url)
 
         # Step 1: Fetch and parse transcript
         self._set_phase("fetching")
@@ -121,8 +138,8 @@ class ExtractTranscriptWorkflow:
         transcript_data = await workflow.execute_activity(
             fetch_transcript,
             args=[url],
-            start_to_close_timeout=timedelta(seconds=60),
-            retry_policy=RetryPolicy(maximum_attempts=3),
+            start_to_close_timeout=FETCH_TIMEOUT,
+            retry_policy=ACTIVITY_RETRY,
         )
 
         self._title = transcript_data["title"]
@@ -134,12 +151,12 @@ class ExtractTranscriptWorkflow:
             SA_TRANSCRIPT_TITLE.value_set(self._title),
         ])
 
-        log.info(workflow.logger, MODULE, "fetched",
-                 "Transcript fetched",
-                 title=self._title,
-                 word_count=self._word_count,
-                 segment_count=self._segment_count,
-                 speakers=self._speakers)
+        tlog.info("fetched",
+                  "Transcript fetched",
+                  title=self._title,
+                  word_count=self._word_count,
+                  segment_count=self._segment_count,
+                  speakers=self._speakers)
 
         # Step 2: Build batch specs and extract in parallel
         self._set_phase("extracting")
@@ -150,10 +167,10 @@ class ExtractTranscriptWorkflow:
         batches = build_batches(segment_word_counts)
         self._batch_count = len(batches)
 
-        log.info(workflow.logger, MODULE, "batching",
-                 "Extraction batches planned",
-                 batch_count=self._batch_count,
-                 segment_count=self._segment_count)
+        tlog.info("batching",
+                  "Extraction batches planned",
+                  batch_count=self._batch_count,
+                  segment_count=self._segment_count)
 
         # 2 concurrent batches to match LLM server parallelism
         MAX_CONCURRENT_BATCHES = 2
@@ -173,9 +190,8 @@ class ExtractTranscriptWorkflow:
                         label,
                         self._title,
                     ],
-                    # Structured output for 30-40 segments can take 15-25 min on local LLM
-                    start_to_close_timeout=timedelta(seconds=1800),
-                    retry_policy=RetryPolicy(maximum_attempts=3),
+                    start_to_close_timeout=EXTRACT_BATCH_TIMEOUT,
+                    retry_policy=ACTIVITY_RETRY,
                 )
                 self._batches_done += 1
                 return result
@@ -184,8 +200,8 @@ class ExtractTranscriptWorkflow:
         store_result = await workflow.execute_activity(
             store_transcript,
             args=[transcript_data],
-            start_to_close_timeout=timedelta(seconds=60),
-            retry_policy=RetryPolicy(maximum_attempts=3),
+            start_to_close_timeout=STORE_TRANSCRIPT_TIMEOUT,
+            retry_policy=ACTIVITY_RETRY,
         )
 
         batch_results = await asyncio.gather(
@@ -193,6 +209,8 @@ class ExtractTranscriptWorkflow:
             return_exceptions=True,
         )
         self._transcript_id = store_result["transcript_id"]
+        tlog = log.bind(workflow.logger, MODULE,
+                        transcript_id=self._transcript_id)
 
         # Build speaker → description lookup from Wikidata-enriched speakers
         speaker_descriptions = {}
@@ -205,16 +223,16 @@ class ExtractTranscriptWorkflow:
         for i, result in enumerate(batch_results):
             if isinstance(result, Exception):
                 self._batches_failed += 1
-                log.warning(workflow.logger, MODULE, "batch_failed",
-                            f"Batch {i+1} failed",
-                            error=str(result))
+                tlog.warning("batch_failed",
+                             f"Batch {i+1} failed",
+                             error=str(result))
             else:
                 all_batch_claims.append(result)
 
-        log.info(workflow.logger, MODULE, "extraction_done",
-                 "All batches complete",
-                 succeeded=len(all_batch_claims),
-                 failed=self._batches_failed)
+        tlog.info("extraction_done",
+                  "All batches complete",
+                  succeeded=len(all_batch_claims),
+                  failed=self._batches_failed)
 
         # Step 3: Finalize — dedup + filter across batches
         self._set_phase("finalizing")
@@ -222,8 +240,8 @@ class ExtractTranscriptWorkflow:
         finalize_result = await workflow.execute_activity(
             finalize_extraction,
             args=[transcript_data, all_batch_claims],
-            start_to_close_timeout=timedelta(seconds=30),
-            retry_policy=RetryPolicy(maximum_attempts=2),
+            start_to_close_timeout=FINALIZE_TIMEOUT,
+            retry_policy=SHORT_RETRY,
         )
 
         claims = finalize_result["worth_checking"]
@@ -239,18 +257,18 @@ class ExtractTranscriptWorkflow:
             SA_CLAIM_COUNT.value_set(self._claim_count),
         ])
 
-        log.info(workflow.logger, MODULE, "finalized",
-                 "Claims finalized",
-                 worth_checking=len(claims),
-                 total_stored=len(all_claims_for_storage))
+        tlog.info("finalized",
+                  "Claims finalized",
+                  worth_checking=len(claims),
+                  total_stored=len(all_claims_for_storage))
 
         # Step 3b: Store ALL extracted claims in DB (linked to transcript)
         if self._transcript_id and all_claims_for_storage:
             tc_ids = await workflow.execute_activity(
                 store_transcript_claims,
                 args=[self._transcript_id, all_claims_for_storage],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=STORE_CLAIMS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
 
             # Use surviving_indices to pick the tc_ids that correspond
@@ -269,18 +287,18 @@ class ExtractTranscriptWorkflow:
             # Step 4: Batch-create Claim records and link FKs (only for worth_checking)
             self._set_phase("submitting")
 
-            log.info(workflow.logger, MODULE, "creating_claims",
-                     "Batch-creating Claim records for verification",
-                     claim_count=len(claims),
-                     tc_id_count=len(worth_checking_tc_ids))
+            tlog.info("creating_claims",
+                      "Batch-creating Claim records for verification",
+                      claim_count=len(claims),
+                      tc_id_count=len(worth_checking_tc_ids))
 
             claim_ids = await workflow.execute_activity(
                 create_claims_for_transcript,
                 args=[self._transcript_id, worth_checking_tc_ids, claims,
                       transcript_data.get("date"), self._title,
                       speaker_descriptions],
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=CREATE_CLAIMS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
             self._verification_submitted = len(claim_ids)
 
@@ -288,23 +306,23 @@ class ExtractTranscriptWorkflow:
             await workflow.execute_activity(
                 update_transcript_status,
                 args=[self._transcript_id, "verifying"],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=STATUS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
 
             # Notify frontend that extraction is done and claims are ready
             await workflow.execute_activity(
                 notify_frontend_refresh,
-                start_to_close_timeout=timedelta(seconds=10),
-                retry_policy=RetryPolicy(maximum_attempts=1),
+                start_to_close_timeout=NOTIFY_TIMEOUT,
+                retry_policy=NOTIFY_RETRY,
             )
 
             self._set_phase("verifying")
             transcript_date = transcript_data.get("date")
 
-            log.info(workflow.logger, MODULE, "verification_started",
-                     "Starting sequential child verification workflows",
-                     claim_count=len(claim_ids))
+            tlog.info("verification_started",
+                      "Starting sequential child verification workflows",
+                      claim_count=len(claim_ids))
 
             verified = 0
             failed = 0
@@ -325,28 +343,27 @@ class ExtractTranscriptWorkflow:
                     verified += 1
                 except Exception as e:
                     failed += 1
-                    log.warning(workflow.logger, MODULE,
-                                "child_verify_failed",
-                                "Child verification workflow failed",
-                                claim_id=claim_id_str,
-                                error=str(e))
+                    tlog.warning("child_verify_failed",
+                                 "Child verification workflow failed",
+                                 claim_id=claim_id_str,
+                                 error=str(e))
 
-            log.info(workflow.logger, MODULE, "verification_done",
-                     "All child verifications complete",
-                     verified=verified, failed=failed)
+            tlog.info("verification_done",
+                      "All child verifications complete",
+                      verified=verified, failed=failed)
 
             # Mark transcript complete and start next queued transcript
             await workflow.execute_activity(
                 update_transcript_status,
                 args=[self._transcript_id, "complete"],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=STATUS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
 
             await workflow.execute_activity(
                 finish_transcript_and_start_next,
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=2),
+                start_to_close_timeout=FINISH_TRANSCRIPT_TIMEOUT,
+                retry_policy=SHORT_RETRY,
             )
 
         elif self._transcript_id and not claims and all_claims_for_storage:
@@ -354,49 +371,49 @@ class ExtractTranscriptWorkflow:
             await workflow.execute_activity(
                 store_transcript_claims,
                 args=[self._transcript_id, all_claims_for_storage],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=STORE_CLAIMS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
             await workflow.execute_activity(
                 update_transcript_status,
                 args=[self._transcript_id, "complete"],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=STATUS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
 
             await workflow.execute_activity(
                 finish_transcript_and_start_next,
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=2),
+                start_to_close_timeout=FINISH_TRANSCRIPT_TIMEOUT,
+                retry_policy=SHORT_RETRY,
             )
 
-            log.info(workflow.logger, MODULE, "no_worth_checking",
-                     "No worth-checking claims, stored skipped claims",
-                     stored=len(all_claims_for_storage))
+            tlog.info("no_worth_checking",
+                      "No worth-checking claims, stored skipped claims",
+                      stored=len(all_claims_for_storage))
 
         elif self._transcript_id:
             # No claims at all — mark complete and try next queued transcript
             await workflow.execute_activity(
                 update_transcript_status,
                 args=[self._transcript_id, "complete"],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=STATUS_TIMEOUT,
+                retry_policy=ACTIVITY_RETRY,
             )
 
             await workflow.execute_activity(
                 finish_transcript_and_start_next,
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=2),
+                start_to_close_timeout=FINISH_TRANSCRIPT_TIMEOUT,
+                retry_policy=SHORT_RETRY,
             )
 
-            log.info(workflow.logger, MODULE, "no_claims",
-                     "No claims extracted, transcript marked complete")
+            tlog.info("no_claims",
+                      "No claims extracted, transcript marked complete")
 
         # Notify frontend (fire-and-forget, don't fail workflow)
         await workflow.execute_activity(
             notify_frontend_refresh,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(maximum_attempts=1),
+            start_to_close_timeout=NOTIFY_TIMEOUT,
+            retry_policy=NOTIFY_RETRY,
         )
 
         # Done
@@ -414,9 +431,9 @@ class ExtractTranscriptWorkflow:
             "verification_submitted": self._verification_submitted,
         }
 
-        log.info(workflow.logger, MODULE, "complete",
-                 "Transcript extraction complete",
-                 title=self._title,
-                 claim_count=self._claim_count)
+        tlog.info("complete",
+                  "Transcript extraction complete",
+                  title=self._title,
+                  claim_count=self._claim_count)
 
         return result
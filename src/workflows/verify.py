@@ -1,34 +1,49 @@
 """Temporal workflow for claim verification.
 
 Flat pipeline — no recursion:
-  0. Create claim record (if not already in DB)
+  0. Create claim record (if not already in DB) — concurrent with step 1
   1. Decompose claim into atomic facts (2 LLM calls: normalize + extract)
      — each fact gets categories, seed_queries from the LLM
      — interested parties expanded via Wikidata (programmatic)
-  2. Research all facts (separate phase)
+  2. Research each fact
      — full interested_parties dict passed for conflict detection
      — MBFC ownership → Wikidata enrichment (overlap-gated)
      — evidence NER → Wikidata enrichment (overlap-gated)
-     — enriched parties merged across sub-claims for judge phase
-  3. Judge all facts (separate phase)
-     — receives merged interested parties from all research sub-claims
+     — enriched parties merged across sub-claims as results arrive
+  3. Judge each fact as soon as its own research returns
+     — receives interested parties merged from all research finished so far
   4. Synthesize all verdicts into a final result
-  5. Store result + start next queued claim
+  5. Store result + start next queued claim (single finalize activity)
 
-Research and judge are SEPARATE PHASES to prevent longer judge calls
-(structured rubric evaluation) from starving the faster research agents.
+Research and judge run as a per-fact pipeline with SEPARATE LIMITS on how
+many of each this workflow schedules at once, so a backlog of slow judge
+calls (structured rubric evaluation) doesn't stop new research from being
+scheduled. Both still compete for the worker's max_concurrent_activities
+slots — the limits shape what is queued, not which worker slot runs it.
 
 Follows Google's SAFE (NeurIPS 2024) and FActScore:
 extract all facts in one pass, verify each independently, aggregate.
 
 Concurrency is tuned for the local LLM server. MAX_CONCURRENT=2 gives
-each research agent a dedicated inference slot (2 × 65K context).
+each research agent a dedicated inference slot (2 × 65K context). The
+limits start at MAX_CONCURRENT and back off — halved when a call fails for
+capacity reasons (timeout, LLM server unreachable/overloaded), +1 per
+success back up to the ceiling — so an overloaded server sheds load
+mid-claim. Other failures (bad inputs, validation) leave the limit alone.
+
+There are no workflow.patched() gates: changing the order of activities
+started here breaks replay of in-flight histories. Drain running
+VerifyClaimWorkflows before deploying such a change (see ARCHITECTURE.md,
+"Deploying workflow changes").
 """
 
 import asyncio
+import re
 from datetime import timedelta
 from temporalio import workflow
 from temporalio.common import RetryPolicy, SearchAttributeKey
+from temporalio.exceptions import ActivityError, ApplicationError
+from temporalio.exceptions import TimeoutError as ActivityTimeoutError
 
 with workflow.unsafe.imports_passed_through():
     from src.activities.verify_activities import (
@@ -36,9 +51,9 @@ with workflow.unsafe.imports_passed_through():
         decompose_claim,
         research_subclaim,
         judge_subclaim,
+        research_and_judge,
         synthesize_verdict,
-        store_result,
-        start_next_queued_claim,
+        finalize_claim,
     )
     from src.activities.transcript_activities import (
         finish_transcript_and_start_next,
@@ -52,10 +67,63 @@ MODULE = "workflow"
 # 10 facts × ~4 min each ÷ 2 concurrent = ~20 min total.
 MAX_FACTS = 10
 
-# Maximum concurrent research+judge pipelines. Matched to --parallel 2 on
-# the LLM server — 2 slots × 65K context each (131K total ctx-size).
+# Ceiling on concurrent research calls, and separately judge calls. Matched
+# to --parallel 2 on the LLM server — 2 slots × 65K context each (131K total
+# ctx-size). The worker's max_concurrent_activities=2 caps the combined total.
+# The live limit adapts below this ceiling (see _AdaptiveLimit).
 MAX_CONCURRENT = 2
 
+# Synthesis is skipped when every sub-verdict agrees at or above this
+# confidence — the LLM would only restate the shared verdict.
+UNANIMOUS_MIN_CONFIDENCE = 0.9
+
+# Cap on merged interested parties passed to each judge call
+MAX_ALL_PARTIES = 40
+
+# Retry policies. Temporal's default backoff is uncapped, so a tail retry
+# after a long research timeout could add minutes; cap the interval at 15s.
+# ValueError/ValidationError are deterministic (bad inputs, schema bugs) —
+# fail fast instead of burning three full LLM runs. Transient LLM output
+# problems are already retried inside the invoker and surface as
+# LLMInvocationError, which stays retryable.
+_NON_RETRYABLE = ["ValidationError", "ValueError"]
+
+# decompose / research / judge / synthesize — every LLM-bound activity
+LLM_RETRY = RetryPolicy(
+    initial_interval=timedelta(seconds=2),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=15),
+    maximum_attempts=3,
+    non_retryable_error_types=_NON_RETRYABLE,
+)
+
+# create_claim / finalize_claim — DB writes
+FAST_RETRY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=5),
+    maximum_attempts=3,
+    non_retryable_error_types=_NON_RETRYABLE,
+)
+
+# finish_transcript_and_start_next — idempotent, next claim re-checks anyway
+CHAIN_RETRY = RetryPolicy(maximum_attempts=2)
+
+# notify_frontend_refresh — fire-and-forget
+NOTIFY_RETRY = RetryPolicy(maximum_attempts=1)
+
+# Activity start-to-close timeouts. Allocated once per worker rather than
+# on every run (and every replay).
+CREATE_TIMEOUT = timedelta(seconds=15)
+DECOMPOSE_TIMEOUT = timedelta(seconds=180)
+RESEARCH_TIMEOUT = timedelta(seconds=540)
+JUDGE_TIMEOUT = timedelta(seconds=300)
+RESEARCH_AND_JUDGE_TIMEOUT = RESEARCH_TIMEOUT + JUDGE_TIMEOUT
+SYNTHESIZE_TIMEOUT = timedelta(seconds=300)
+FINALIZE_TIMEOUT = timedelta(seconds=60)
+FINISH_TRANSCRIPT_TIMEOUT = timedelta(seconds=30)
+NOTIFY_TIMEOUT = timedelta(seconds=10)
+
 # Search attribute keys for Temporal UI visibility
 SA_PHASE = SearchAttributeKey.for_keyword("Phase")
 SA_FACT_COUNT = SearchAttributeKey.for_int("FactCount")
@@ -65,14 +133,106 @@ SA_VERDICT = SearchAttributeKey.for_keyword("Verdict")
 SA_CONFIDENCE = SearchAttributeKey.for_float("Confidence")
 
 
+def _short(s: str, n: int = 120) -> str:
+    """Truncate text for log fields. Full text stays in activity inputs."""
+    return s if len(s) <= n else s[:n] + "…"
+
+
+def _fact_key(text: str) -> str:
+    """Normalize fact text for dedup: lowercase, punctuation/whitespace collapsed."""
+    return re.sub(r"\W+", " ", text.lower()).strip()
+
+
+def _unanimous_result(claim_text: str, sub_results: list[dict]) -> dict | None:
+    """Deterministic synthesis for unanimous, high-confidence sub-verdicts.
+
+    Returns a result shaped like synthesize()'s output, or None when the
+    sub-verdicts disagree or any is below UNANIMOUS_MIN_CONFIDENCE.
+    """
+    if not sub_results:
+        return None
+    verdicts = {r.get("verdict") for r in sub_results}
+    min_conf = min(r.get("confidence", 0.0) for r in sub_results)
+    if len(verdicts) != 1 or min_conf < UNANIMOUS_MIN_CONFIDENCE:
+        return None
+    verdict = verdicts.pop()
+    return {
+        "sub_claim": claim_text,
+        "verdict": verdict,
+        "confidence": min_conf,
+        "reasoning": (
+            f"All {len(sub_results)} sub-claims were independently judged "
+            f"{verdict.replace('_', ' ')} with confidence of at least "
+            f"{min_conf:.2f}."
+        ),
+        "evidence": [],
+        "child_results": sub_results,
+        "reasoning_chain": [r.get("reasoning", "") for r in sub_results],
+        "citations": [],
+        "synthesis_rubric": None,
+    }
+
+
+# Activity failure types that mean the LLM server is out of capacity
+# (openai client errors from the ChatOpenAI backend), as opposed to bad
+# inputs or a schema bug
+_CAPACITY_ERRORS = frozenset({
+    "APITimeoutError", "APIConnectionError", "InternalServerError",
+    "RateLimitError",
+})
+
+
+def _is_capacity_failure(exc: BaseException) -> bool:
+    """True if an activity failed from timeout or LLM server overload."""
+    cause = exc.cause if isinstance(exc, ActivityError) else exc
+    if isinstance(cause, ActivityTimeoutError):
+        return True
+    return isinstance(cause, ApplicationError) and cause.type in _CAPACITY_ERRORS
+
+
+class _AdaptiveLimit:
+    """Backoff concurrency limit for LLM-bound activities.
+
+    Starts at the ceiling — with 2 LLM slots there is no headroom to probe
+    above it. A call that fails for capacity reasons (activity timeout,
+    LLM server unreachable or overloaded — see _is_capacity_failure)
+    halves the limit, down to 1; each success adds 1 back, up to the
+    ceiling. Other failures (non-retryable ValueError/ValidationError,
+    research tool errors) say nothing about load and leave it unchanged.
+
+    Driven only by activity outcomes, so it replays deterministically.
+    """
+
+    def __init__(self, ceiling: int):
+        self.ceiling = ceiling
+        self.limit = ceiling
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._active -= 1
+            if exc_type is None:
+                self.limit = min(self.ceiling, self.limit + 1)
+            elif isinstance(exc, Exception) and _is_capacity_failure(exc):
+                self.limit = max(1, self.limit // 2)
+            self._cond.notify_all()
+        return False
+
+
 @workflow.defn
 class VerifyClaimWorkflow:
     """Orchestrates the full claim verification pipeline.
 
-    Flat pipeline with separate research and judge phases:
+    Flat pipeline, research → judge overlapped per fact:
     1. Decompose claim into atomic facts (2 LLM calls + Wikidata expansion)
-    2. Research all facts (Phase 1: seed search + rank, Phase 2: ReAct agent)
-    3. Judge all facts (evidence annotation + LLM verdict)
+    2. Research each fact (Phase 1: seed search + rank, Phase 2: ReAct agent)
+    3. Judge each fact once its research is done (annotation + LLM verdict)
     4. Synthesize all sub-verdicts into final verdict
     5. Store result in database + start next queued claim
     """
@@ -154,32 +314,45 @@ class VerifyClaimWorkflow:
         """
         self._claim_text = claim_text
 
-        # Step 0: Create claim record if we don't have one
-        if not claim_id:
-            self._set_phase("creating_claim")
-            claim_id = await workflow.execute_activity(
-                create_claim,
-                args=[claim_text],
-                start_to_close_timeout=timedelta(seconds=15),
-                retry_policy=RetryPolicy(maximum_attempts=3),
-            )
-            log.info(workflow.logger, MODULE, "claim_created", "Created claim record",
-                     claim_id=claim_id)
-
-        log.info(workflow.logger, MODULE, "started", "Starting verification pipeline",
-                 claim_id=claim_id, claim=claim_text)
-
-        # Step 1: Normalize + Decompose
+        # Steps 0+1: Normalize + decompose, and create the claim record if
+        # we don't have one. Decomposition doesn't need the DB row, so the
+        # insert overlaps the LLM call instead of preceding it.
         self._set_phase("decomposing")
 
-        decomposition = await workflow.execute_activity(
+        decompose_handle = workflow.start_activity(
             decompose_claim,
             args=[claim_text, speaker, claim_date, transcript_title,
                   speaker_description],
-            start_to_close_timeout=timedelta(seconds=180),
-            retry_policy=RetryPolicy(maximum_attempts=3),
+            start_to_close_timeout=DECOMPOSE_TIMEOUT,
+            retry_policy=LLM_RETRY,
         )
 
+        if not claim_id:
+            try:
+                claim_id = await workflow.execute_activity(
+                    create_claim,
+                    args=[claim_text],
+                    start_to_close_timeout=CREATE_TIMEOUT,
+                    retry_policy=FAST_RETRY,
+                )
+            except Exception:
+                decompose_handle.cancel()
+                raise
+            log.info(workflow.logger, MODULE, "claim_created", "Created claim record",
+                     claim_id=claim_id)
+
+        # Normalize once so no log line or activity arg ever carries a
+        # uuid.UUID (which json.dumps can only handle via default=str)
+        claim_id = str(claim_id)
+
+        # Every workflow log line carries module + claim_id
+        wlog = log.bind(workflow.logger, MODULE, claim_id=claim_id)
+
+        wlog.info("started", "Starting verification pipeline",
+                  claim=_short(claim_text))
+
+        decomposition = await decompose_handle
+
         atomic_facts = decomposition["facts"]
         thesis_info = decomposition.get("thesis_info", {})
 
@@ -192,21 +365,14 @@ class VerifyClaimWorkflow:
         else:
             speaker_context = speaker
 
-        interested_parties = thesis_info.get("interested_parties", {})
-        if isinstance(interested_parties, list):
-            interested_parties = {
-                "all_parties": interested_parties,
-                "direct": interested_parties,
-                "institutional": [],
-                "affiliated_media": [],
-                "reasoning": None,
-            }
+        # Already canonical dict form — decompose_claim normalizes it
+        interested_parties = thesis_info["interested_parties"]
 
         # Cap to prevent runaway decompositions
         if len(atomic_facts) > MAX_FACTS:
-            log.warning(workflow.logger, MODULE, "facts_capped",
-                        "Capping atomic facts",
-                        original=len(atomic_facts), capped=MAX_FACTS)
+            wlog.warning("facts_capped",
+                         "Capping atomic facts",
+                         original=len(atomic_facts), capped=MAX_FACTS)
             atomic_facts = atomic_facts[:MAX_FACTS]
 
         # Update state after decompose
@@ -220,13 +386,20 @@ class VerifyClaimWorkflow:
             SA_FACT_COUNT.value_set(self._fact_count),
         ])
 
-        log.info(workflow.logger, MODULE, "decomposed",
-                 "Claim decomposed into atomic facts",
-                 claim_id=claim_id, fact_count=len(atomic_facts),
-                 facts=[f["text"] for f in atomic_facts],
-                 thesis=thesis_info.get("thesis"),
-                 structure=thesis_info.get("structure"),
-                 interested_parties=interested_parties)
+        wlog.info("decomposed",
+                  "Claim decomposed into atomic facts",
+                  fact_count=len(atomic_facts),
+                  thesis=thesis_info.get("thesis"),
+                  structure=thesis_info.get("structure"),
+                  interested_party_count=self._interested_parties_count,
+                  interested_parties=_short(", ".join(
+                      interested_parties.get("all_parties", []))))
+        # Full payloads only at DEBUG (LOG_LEVEL=DEBUG) — reuses the list
+        # built for status()
+        wlog.debug("decomposed_facts",
+                   "Atomic fact texts and interested parties",
+                   facts=self._facts,
+                   interested_parties=interested_parties)
 
         # Build verification_target lookup for judge phase
         verification_targets = {
@@ -240,111 +413,92 @@ class VerifyClaimWorkflow:
         # that skip synthesis entirely).
         key_test = thesis_info.get("key_test", "")
 
-        # Step 2: Research all facts (thinking=off, fast)
+        # Steps 2+3: Research → judge pipeline, one per fact. Each fact's
+        # judge starts as soon as its own research returns — no global
+        # barrier between phases. Separate adaptive limits cap in-flight research
+        # (thinking=off, fast) and judge (thinking=on, slow) calls this
+        # workflow schedules; both still share the worker's activity slots.
         self._set_phase("researching")
 
-        async def _research(fact: dict) -> tuple[str, list, dict]:
-            """Research a single fact, return (fact_text, evidence, enriched_parties)."""
-            fact_text = fact["text"]
-            fact_categories = fact.get("categories", ["GENERAL"])
-            fact_seed_queries = fact.get("seed_queries", [])
-            log.info(workflow.logger, MODULE, "research_start",
-                     "Researching fact",
-                     claim_id=claim_id, fact=fact_text,
-                     categories=fact_categories,
-                     seed_query_count=len(fact_seed_queries))
-            result = await workflow.execute_activity(
-                research_subclaim,
-                args=[fact_text, interested_parties,
-                      fact_categories, fact_seed_queries, speaker_context,
-                      claim_date, claim_text, transcript_title],
-                start_to_close_timeout=timedelta(seconds=540),
-                retry_policy=RetryPolicy(maximum_attempts=3),
-            )
-            # Update progress
-            ev_count = len(result.get("evidence", []))
-            self._research_done += 1
-            self._evidence_counts[fact_text] = ev_count
-            workflow.upsert_search_attributes([
-                SA_RESEARCH_PROGRESS.value_set(
-                    f"{self._research_done}/{self._fact_count}",
-                ),
-            ])
-            return (fact_text, result["evidence"], result.get("enriched_parties", {}))
-
-        # Sliding window concurrency
-        research_semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-
-        async def _research_with_limit(fact: dict) -> tuple[str, list, dict]:
-            async with research_semaphore:
-                return await _research(fact)
-
-        log.info(workflow.logger, MODULE, "research_phase_start",
-                 "Starting research phase with sliding window",
-                 claim_id=claim_id, fact_count=len(atomic_facts),
-                 max_concurrent=MAX_CONCURRENT)
+        research_limit = _AdaptiveLimit(MAX_CONCURRENT)
+        judge_limit = _AdaptiveLimit(MAX_CONCURRENT)
 
-        _t0 = workflow.time()
-        research_results = await asyncio.gather(
-            *[_research_with_limit(fact) for fact in atomic_facts],
-            return_exceptions=True
-        )
-
-        # Filter out failures and merge enriched parties
-        all_evidence = []
+        # Enriched parties merged across research results as they arrive
         merged_all_parties = set(interested_parties.get("all_parties", []))
         merged_affiliated_media = set(interested_parties.get("affiliated_media", []))
 
-        for i, result in enumerate(research_results):
-            if isinstance(result, Exception):
-                log.warning(workflow.logger, MODULE, "research_failed",
-                            "Research failed for fact, skipping",
-                            claim_id=claim_id, fact=atomic_facts[i]["text"],
-                            error=str(result))
-                self._research_failed += 1
-            else:
-                fact_text, evidence, enriched = result
-                all_evidence.append((fact_text, evidence))
-                if enriched:
-                    merged_all_parties.update(enriched.get("all_parties", []))
-                    merged_affiliated_media.update(enriched.get("affiliated_media", []))
-
-        # Build merged interested parties for the judge phase
-        MAX_ALL_PARTIES = 40
-        merged_parties_list = list(merged_all_parties)
-        if len(merged_parties_list) > MAX_ALL_PARTIES:
-            log.warning(workflow.logger, MODULE, "parties_capped",
-                        "Capping merged all_parties to prevent explosion",
-                        before=len(merged_parties_list), after=MAX_ALL_PARTIES)
-            merged_parties_list = merged_parties_list[:MAX_ALL_PARTIES]
-        merged_parties = dict(interested_parties)
-        merged_parties["all_parties"] = merged_parties_list
-        merged_parties["affiliated_media"] = list(merged_affiliated_media)
-
-        self._interested_parties_count = len(merged_parties_list)
-
-        _research_ms = round((workflow.time() - _t0) * 1000)
-        log.info(workflow.logger, MODULE, "research_phase_done",
-                 "Research phase completed",
-                 claim_id=claim_id, latency_ms=_research_ms,
-                 succeeded=len(all_evidence), failed=self._research_failed,
-                 merged_parties=len(merged_all_parties),
-                 merged_media=len(merged_affiliated_media))
-
-        # Step 3: Judge all facts (thinking=on, slow)
-        self._set_phase("judging")
+        def _merged_parties(fact_text: str) -> dict:
+            """Snapshot of interested parties merged from research so far."""
+            parties_list = list(merged_all_parties)
+            if len(parties_list) > MAX_ALL_PARTIES:
+                wlog.warning("parties_capped",
+                             "Capping merged all_parties to prevent explosion",
+                             fact=_short(fact_text), before=len(parties_list),
+                             after=MAX_ALL_PARTIES)
+                parties_list = parties_list[:MAX_ALL_PARTIES]
+            merged = dict(interested_parties)
+            merged["all_parties"] = parties_list
+            merged["affiliated_media"] = list(merged_affiliated_media)
+            self._interested_parties_count = max(
+                self._interested_parties_count, len(parties_list),
+            )
+            return merged
+
+        async def _research(fact: dict) -> tuple[list, dict]:
+            """Research a single fact, return (evidence, enriched_parties)."""
+            fact_text = fact["text"]
+            fact_categories = fact.get("categories", ["GENERAL"])
+            fact_seed_queries = fact.get("seed_queries", [])
+            async with research_limit:
+                # Logged and timed once a slot is free, so latency_ms
+                # matches judge_done (activity time, not queue wait)
+                wlog.info("research_start",
+                          "Researching fact",
+                          fact=_short(fact_text),
+                          categories=fact_categories,
+                          seed_query_count=len(fact_seed_queries))
+                _t_fact = workflow.time()
+                result = await workflow.execute_activity(
+                    research_subclaim,
+                    args=[fact_text, interested_parties,
+                          fact_categories, fact_seed_queries, speaker_context,
+                          claim_date, claim_text, transcript_title],
+                    start_to_close_timeout=RESEARCH_TIMEOUT,
+                    retry_policy=LLM_RETRY,
+                )
+            wlog.info("research_done",
+                      "Fact research completed",
+                      fact=_short(fact_text),
+                      evidence_count=len(result.get("evidence", [])),
+                      latency_ms=round((workflow.time() - _t_fact) * 1000))
+            return (result["evidence"], result.get("enriched_parties", {}))
+
+        # One research run per distinct fact — duplicates await the same task
+        research_tasks: dict[str, asyncio.Future] = {}
+
+        def _shared_research(fact: dict) -> asyncio.Future:
+            key = _fact_key(fact["text"])
+            if key not in research_tasks:
+                research_tasks[key] = asyncio.ensure_future(_research(fact))
+            return research_tasks[key]
 
         async def _judge(fact_text: str, evidence: list,
                          merged_p: dict) -> dict:
             """Judge a single fact given its evidence."""
             vt = verification_targets.get(fact_text, "")
+            _t_fact = workflow.time()
             result = await workflow.execute_activity(
                 judge_subclaim,
                 args=[claim_text, fact_text, evidence, merged_p, speaker_context,
                       claim_date, vt, transcript_title, key_test],
-                start_to_close_timeout=timedelta(seconds=300),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=JUDGE_TIMEOUT,
+                retry_policy=LLM_RETRY,
             )
+            wlog.info("judge_done",
+                      "Fact judged",
+                      fact=_short(fact_text),
+                      verdict=result.get("verdict"),
+                      latency_ms=round((workflow.time() - _t_fact) * 1000))
             # Update progress
             self._judge_done += 1
             self._sub_verdicts.append({
@@ -361,109 +515,207 @@ class VerifyClaimWorkflow:
             ])
             return result
 
-        judge_semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+        async def _pipeline(fact: dict) -> dict | None:
+            """Research then judge one fact. Returns None if either stage fails.
 
-        async def _judge_with_limit(fact_text: str, evidence: list) -> dict:
-            async with judge_semaphore:
-                return await _judge(fact_text, evidence, merged_parties)
+            Facts whose normalized text matches share one research run, but
+            each is still judged on its own wording.
+            """
+            fact_text = fact["text"]
+            try:
+                evidence, enriched = await _shared_research(fact)
+                # Update progress
+                self._research_done += 1
+                self._evidence_counts[fact_text] = len(evidence)
+                workflow.upsert_search_attributes([
+                    SA_RESEARCH_PROGRESS.value_set(
+                        f"{self._research_done}/{self._fact_count}",
+                    ),
+                ])
+            except Exception as e:
+                wlog.warning("research_failed",
+                             "Research failed for fact, skipping",
+                             fact=_short(fact_text), error=str(e),
+                             research_limit=research_limit.limit)
+                self._research_failed += 1
+                return None
+            finally:
+                # Last research out flips the phase — only judges remain
+                if self._research_done + self._research_failed == self._fact_count:
+                    self._set_phase("judging")
+
+            if enriched:
+                merged_all_parties.update(enriched.get("all_parties", []))
+                merged_affiliated_media.update(enriched.get("affiliated_media", []))
+
+            try:
+                async with judge_limit:
+                    return await _judge(fact_text, evidence,
+                                        _merged_parties(fact_text))
+            except Exception as e:
+                wlog.warning("judge_failed",
+                             "Judge failed for fact, skipping",
+                             fact=_short(fact_text), error=str(e),
+                             judge_limit=judge_limit.limit)
+                self._judge_failed += 1
+                return None
 
-        log.info(workflow.logger, MODULE, "judge_phase_start",
-                 "Starting judge phase with sliding window",
-                 claim_id=claim_id, evidence_count=len(all_evidence),
-                 max_concurrent=MAX_CONCURRENT)
+        async def _research_and_judge(fact: dict) -> dict | None:
+            """Single-fact claims: research + judge fused into one activity.
+
+            No sibling facts means no cross-fact party merge to wait for, so
+            the activity merges this fact's own enriched parties itself.
+            """
+            fact_text = fact["text"]
+            wlog.info("research_start",
+                      "Researching and judging fact (fused)",
+                      fact=_short(fact_text),
+                      categories=fact.get("categories", ["GENERAL"]),
+                      seed_query_count=len(fact.get("seed_queries", [])))
+            _t_fact = workflow.time()
+            try:
+                fused = await workflow.execute_activity(
+                    research_and_judge,
+                    args=[claim_text, fact_text, interested_parties,
+                          fact.get("categories", ["GENERAL"]),
+                          fact.get("seed_queries", []), speaker_context,
+                          claim_date, transcript_title,
+                          verification_targets.get(fact_text, ""), key_test,
+                          MAX_ALL_PARTIES],
+                    start_to_close_timeout=RESEARCH_AND_JUDGE_TIMEOUT,
+                    retry_policy=LLM_RETRY,
+                )
+            except Exception as e:
+                # Evidence never reached the workflow — count it as research
+                wlog.warning("research_failed",
+                             "Research/judge failed for fact, skipping",
+                             fact=_short(fact_text), error=str(e))
+                self._research_failed += 1
+                return None
+
+            result = fused["judgment"]
+            wlog.info("judge_done",
+                      "Fact researched and judged",
+                      fact=_short(fact_text),
+                      evidence_count=fused["evidence_count"],
+                      verdict=result.get("verdict"),
+                      latency_ms=round((workflow.time() - _t_fact) * 1000))
+            # Update progress
+            self._research_done += 1
+            self._judge_done += 1
+            self._evidence_counts[fact_text] = fused["evidence_count"]
+            self._interested_parties_count = max(
+                self._interested_parties_count, fused["party_count"],
+            )
+            self._sub_verdicts.append({
+                "fact": fact_text,
+                "verdict": result.get("verdict"),
+                "confidence": result.get("confidence"),
+                "evidence_count": len(result.get("evidence", [])),
+                "citations": len(result.get("citations", [])),
+            })
+            workflow.upsert_search_attributes([
+                SA_RESEARCH_PROGRESS.value_set("1/1"),
+                SA_JUDGE_PROGRESS.value_set("1/1"),
+            ])
+            return result
+
+        distinct_facts = len({_fact_key(f["text"]) for f in atomic_facts})
+        if distinct_facts < len(atomic_facts):
+            wlog.info("facts_deduped",
+                      "Duplicate facts share one research run",
+                      fact_count=len(atomic_facts),
+                      distinct=distinct_facts)
+
+        wlog.info("pipeline_start",
+                  "Starting research → judge pipeline",
+                  fact_count=len(atomic_facts),
+                  max_concurrent=MAX_CONCURRENT)
 
         _t0 = workflow.time()
-        judge_results = await asyncio.gather(
-            *[_judge_with_limit(fact_text, evidence) for fact_text, evidence in all_evidence],
-            return_exceptions=True
+        run_fact = _research_and_judge if len(atomic_facts) == 1 else _pipeline
+        pipeline_results = await asyncio.gather(
+            *[run_fact(fact) for fact in atomic_facts]
         )
+        sub_results = [r for r in pipeline_results if r is not None]
 
-        # Filter out failures
-        sub_results = []
-        for i, result in enumerate(judge_results):
-            if isinstance(result, Exception):
-                fact_text, _ = all_evidence[i]
-                log.warning(workflow.logger, MODULE, "judge_failed",
-                            "Judge failed for fact, skipping",
-                            claim_id=claim_id, fact=fact_text,
-                            error=str(result))
-                self._judge_failed += 1
-            else:
-                sub_results.append(result)
-
-        _judge_ms = round((workflow.time() - _t0) * 1000)
-        log.info(workflow.logger, MODULE, "judge_phase_done",
-                 "Judge phase completed",
-                 claim_id=claim_id, latency_ms=_judge_ms,
-                 succeeded=len(sub_results), failed=self._judge_failed)
+        _pipeline_ms = round((workflow.time() - _t0) * 1000)
+        wlog.info("pipeline_done",
+                  "Research → judge pipeline completed",
+                  latency_ms=_pipeline_ms,
+                  research_failed=self._research_failed,
+                  succeeded=len(sub_results), failed=self._judge_failed,
+                  merged_parties=len(merged_all_parties),
+                  merged_media=len(merged_affiliated_media))
 
         # Step 4: Synthesize all verdicts into final result
         self._set_phase("synthesizing")
 
         if len(sub_results) == 1:
-            log.info(workflow.logger, MODULE, "single_fact_skip",
-                     "Single fact — skipping synthesis, using judge result directly",
-                     claim_id=claim_id)
+            wlog.info("single_fact_skip",
+                      "Single fact — skipping synthesis, using judge result directly")
             result = sub_results[0]
+        elif (unanimous := _unanimous_result(claim_text, sub_results)) is not None:
+            wlog.info("unanimous_skip",
+                      "Sub-verdicts unanimous — skipping synthesis",
+                      verdict=unanimous["verdict"],
+                      confidence=unanimous["confidence"],
+                      fact_count=len(sub_results))
+            result = unanimous
         else:
             result = await workflow.execute_activity(
                 synthesize_verdict,
                 args=[claim_text, sub_results, thesis_info, claim_date,
                       transcript_title],
-                start_to_close_timeout=timedelta(seconds=300),
-                retry_policy=RetryPolicy(maximum_attempts=3),
+                start_to_close_timeout=SYNTHESIZE_TIMEOUT,
+                retry_policy=LLM_RETRY,
             )
 
         self._verdict = result.get("verdict", "")
         self._confidence = result.get("confidence", 0.0)
 
-        log.info(workflow.logger, MODULE, "verdict",
-                 "Final verdict reached",
-                 claim_id=claim_id,
-                 verdict=result.get("verdict"),
-                 confidence=result.get("confidence"),
-                 fact_count=len(atomic_facts))
-
-        # Step 5: Store the result
+        # Step 5: Store the result + queue chaining (one activity). Chaining
+        # only applies to standalone workflows, not transcript children.
+        # Started first so the verdict bookkeeping below overlaps the write.
         self._set_phase("storing")
 
-        await workflow.execute_activity(
-            store_result,
-            args=[claim_id, result, thesis_info, atomic_facts],
-            start_to_close_timeout=timedelta(seconds=30),
-            retry_policy=RetryPolicy(maximum_attempts=3),
+        finalize_handle = workflow.start_activity(
+            finalize_claim,
+            args=[claim_id, result, thesis_info, atomic_facts, not is_child],
+            start_to_close_timeout=FINALIZE_TIMEOUT,
+            retry_policy=FAST_RETRY,
         )
 
-        # Step 6: Queue chaining (only for standalone workflows, not children)
-        if not is_child:
-            next_claim = await workflow.execute_activity(
-                start_next_queued_claim,
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=2),
-            )
+        wlog.info("verdict",
+                  "Final verdict reached",
+                  verdict=result.get("verdict"),
+                  confidence=result.get("confidence"),
+                  fact_count=len(atomic_facts))
+        workflow.upsert_search_attributes([
+            SA_VERDICT.value_set(self._verdict),
+            SA_CONFIDENCE.value_set(self._confidence),
+        ])
 
-            # No more queued claims — check if transcript is done
-            if next_claim is None:
-                await workflow.execute_activity(
-                    finish_transcript_and_start_next,
-                    start_to_close_timeout=timedelta(seconds=30),
-                    retry_policy=RetryPolicy(maximum_attempts=2),
-                )
+        next_claim = await finalize_handle
+
+        # No more queued claims — check if transcript is done
+        if not is_child and next_claim is None:
+            await workflow.execute_activity(
+                finish_transcript_and_start_next,
+                start_to_close_timeout=FINISH_TRANSCRIPT_TIMEOUT,
+                retry_policy=CHAIN_RETRY,
+            )
 
         # Notify frontend (fire-and-forget, don't fail workflow)
         await workflow.execute_activity(
             notify_frontend_refresh,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(maximum_attempts=1),
+            start_to_close_timeout=NOTIFY_TIMEOUT,
+            retry_policy=NOTIFY_RETRY,
         )
 
         self._set_phase("complete")
-        workflow.upsert_search_attributes([
-            SA_VERDICT.value_set(self._verdict),
-            SA_CONFIDENCE.value_set(self._confidence),
-        ])
 
-        log.info(workflow.logger, MODULE, "complete", "Verification complete",
-                 claim_id=claim_id, verdict=result.get("verdict"),
-                 confidence=result.get("confidence"))
+        wlog.info("complete", "Verification complete",
+                  verdict=result.get("verdict"),
+                  confidence=result.get("confidence"))
         return result
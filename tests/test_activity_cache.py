@@ -0,0 +1,93 @@
+"""Tests for the in-process activity result cache."""
+
+import asyncio
+
+from src.utils.activity_cache import cached
+
+
+def test_same_args_hit_cache():
+    calls = []
+
+    @cached(ttl_seconds=60)
+    async def work(text: str, parties: dict | None = None) -> dict:
+        calls.append(text)
+        return {"text": text}
+
+    async def run():
+        a = await work("x", parties={"a": 1})
+        b = await work("x", parties={"a": 1})
+        c = await work("y", parties={"a": 1})
+        return a, b, c
+
+    a, b, c = asyncio.run(run())
+    assert a == b == {"text": "x"}
+    assert c == {"text": "y"}
+    assert calls == ["x", "y"]
+
+
+def test_expired_and_failed_calls_rerun():
+    calls = []
+
+    @cached(ttl_seconds=0)
+    async def work(text: str) -> str:
+        calls.append(text)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return text
+
+    async def run():
+        try:
+            await work("x")
+        except RuntimeError:
+            pass
+        await work("x")
+        await work("x")
+
+    asyncio.run(run())
+    assert calls == ["x", "x", "x"]
+
+
+def test_lru_eviction():
+    calls = []
+
+    @cached(ttl_seconds=60, maxsize=1)
+    async def work(text: str) -> str:
+        calls.append(text)
+        return text
+
+    async def run():
+        for t in ("a", "b", "a"):
+            await work(t)
+
+    asyncio.run(run())
+    assert calls == ["a", "b", "a"]
+
+
+def test_should_cache_false_leaves_result_uncached():
+    calls = []
+
+    @cached(ttl_seconds=60, should_cache=lambda r: r != "degraded")
+    async def work(text: str) -> str:
+        calls.append(text)
+        return "degraded" if len(calls) == 1 else text
+
+    async def run():
+        return [await work("x") for _ in range(3)]
+
+    assert asyncio.run(run()) == ["degraded", "x", "x"]
+    assert calls == ["x", "x"]
+
+
+def test_mutating_a_result_does_not_change_the_cache():
+    @cached(ttl_seconds=60)
+    async def work(text: str) -> dict:
+        return {"evidence": [{"content": text}]}
+
+    async def run():
+        first = await work("x")
+        first["evidence"][0]["_rank_score"] = 0.5
+        hit = await work("x")
+        hit["evidence"].clear()
+        return await work("x")
+
+    assert asyncio.run(run()) == {"evidence": [{"content": "x"}]}
@@ -0,0 +1,54 @@
+"""Tests for the shared HTTP connection pool."""
+
+import asyncio
+
+import httpx
+from unittest.mock import patch
+
+from src.utils import http_client
+from src.utils.http_client import close_client, get_client
+
+
+def test_one_pool_per_loop_and_close_resets():
+    async def same_loop():
+        first, second = get_client(), get_client()
+        pool = first._transport
+        await close_client()
+        after_close = get_client()._transport
+        return first, second, pool, after_close
+
+    first, second, pool, after_close = asyncio.run(same_loop())
+    assert first is not second
+    assert second._transport is pool
+    assert after_close is not pool
+
+    async def other_loop():
+        client = get_client()
+        await asyncio.sleep(0)  # let the stale-pool close run
+        await close_client()
+        return client._transport
+
+    closed = []
+    with patch.object(httpx.AsyncHTTPTransport, "aclose",
+                      autospec=True, side_effect=lambda t: closed.append(t)):
+        new_pool = asyncio.run(other_loop())
+    assert new_pool is not after_close
+    assert closed == [after_close, new_pool]
+
+
+def test_cookies_last_one_call_only():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/consent":
+            return httpx.Response(302, headers={"location": "/article",
+                                                "set-cookie": "consent=1; Path=/"})
+        return httpx.Response(200, text=request.headers.get("cookie", ""))
+
+    async def run():
+        with patch.object(http_client, "_get_transport",
+                          return_value=httpx.MockTransport(handler)):
+            first = await get_client().get("https://news.example.com/consent",
+                                           follow_redirects=True)
+            second = await get_client().get("https://news.example.com/article")
+        return first.text, second.text
+
+    assert asyncio.run(run()) == ("consent=1", "")
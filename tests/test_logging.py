@@ -0,0 +1,118 @@
+"""Tests for structured logging (formatter + bound logger)."""
+
+import json
+import logging
+
+from src.utils.logging import (
+    StructuredFormatter, configure_logging, get_logger, log, shutdown_logging,
+)
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _logger(level=logging.INFO):
+    logger = logging.getLogger(f"test.structured.{level}")
+    logger.handlers = []
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = _Capture()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_json_output_drops_none_fields():
+    logger, handler = _logger()
+    log.info(logger, "judge", "done", "Judged", verdict="true", error=None)
+    data = json.loads(StructuredFormatter().format(handler.records[0]))
+    assert data["module"] == "judge"
+    assert data["action"] == "done"
+    assert data["msg"] == "Judged"
+    assert data["verdict"] == "true"
+    assert "error" not in data
+    assert data["ts"].endswith("Z")
+
+
+def test_temporal_context_stripped():
+    record = logging.LogRecord(
+        "x", logging.INFO, __file__, 1,
+        "Activity done ({'activity_id': '1', 'workflow_id': 'w'})", None, None,
+    )
+    data = json.loads(StructuredFormatter().format(record))
+    assert data["msg"] == "Activity done"
+    assert data["module"] == "legacy"
+
+
+def test_disabled_level_is_skipped():
+    logger, handler = _logger(logging.INFO)
+    log.debug(logger, "judge", "detail", "Not emitted", big=[1, 2, 3])
+    assert handler.records == []
+
+
+def test_bound_logger_merges_context():
+    logger, handler = _logger()
+    wlog = log.bind(logger, "workflow", claim_id="abc")
+    wlog.info("started", "Starting", claim="x")
+    wlog.warning("override", "Per-call wins", claim_id="def")
+    first, second = handler.records
+    assert first._module == "workflow"
+    assert first._extra == {"claim_id": "abc", "claim": "x"}
+    assert second._extra["claim_id"] == "def"
+
+
+def test_pretty_format():
+    logger, handler = _logger()
+    log.info(logger, "worker", "ready", "Worker listening", queue="q")
+    line = StructuredFormatter(pretty=True).format(handler.records[0])
+    assert "[WORKER" in line
+    assert "ready: Worker listening | queue=q" in line
+
+
+def test_none_check_does_not_call_eq():
+    class NoEq:
+        def __eq__(self, other):
+            raise ValueError("ambiguous truth value")
+
+        __hash__ = object.__hash__
+
+    logger, handler = _logger()
+    value = NoEq()
+    log.info(logger, "judge", "done", "Judged", value=value, error=None)
+    assert handler.records[0]._extra == {"value": value}
+
+
+def test_shutdown_logging_flushes_queued_records(capsys, monkeypatch):
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    try:
+        configure_logging()
+        log.info(get_logger(), "worker", "stopped", "Worker stopped")
+        shutdown_logging()
+        out = capsys.readouterr().out
+    finally:
+        root.handlers[:] = handlers
+        root.setLevel(level)
+    assert json.loads(out.strip().splitlines()[-1])["action"] == "stopped"
+
+
+def test_temporal_loggers_follow_log_level(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    root = logging.getLogger()
+    temporal = [logging.getLogger(f"temporalio.{n}") for n in ("workflow", "activity")]
+    saved = root.handlers[:], root.level, [t.level for t in temporal]
+    try:
+        configure_logging()
+        assert all(t.isEnabledFor(logging.DEBUG) for t in temporal)
+    finally:
+        shutdown_logging()
+        root.handlers[:] = saved[0]
+        root.setLevel(saved[1])
+        for t, lvl in zip(temporal, saved[2]):
+            t.setLevel(lvl)
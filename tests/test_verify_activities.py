@@ -0,0 +1,206 @@
+"""Tests for retry checkpointing in the fused verification activities."""
+
+import dataclasses
+import os
+import sys
+import types
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from temporalio.testing import ActivityEnvironment
+
+# Cache keys include the serving model name from src.llm.client, which
+# refuses to import without an endpoint configured
+os.environ.setdefault("LLAMA_URL", "http://localhost:3101")
+
+from src.activities.verify_activities import (
+    decompose_claim,
+    finalize_claim,
+    judge_subclaim,
+    research_and_judge,
+    research_subclaim,
+)
+
+MODULE = "src.activities.verify_activities"
+
+
+def _agent(name: str, **attrs) -> dict:
+    """sys.modules entry replacing one src.agent module for a test."""
+    return {f"src.agent.{name}": types.SimpleNamespace(**attrs)}
+
+
+def _parties(parties=None) -> dict:
+    return {"all_parties": list(parties or []), "affiliated_media": []}
+
+
+def _env(heartbeats: list, details: list | None = None) -> ActivityEnvironment:
+    """ActivityEnvironment recording heartbeats, optionally as a retry."""
+    env = ActivityEnvironment()
+    env.on_heartbeat = lambda *d: heartbeats.append(d[0])
+    if details is not None:
+        env.info = dataclasses.replace(env.info, attempt=2, heartbeat_details=details)
+    return env
+
+
+# ---------- finalize_claim ----------
+
+async def test_finalize_retry_reruns_only_the_failed_store():
+    heartbeats = []
+    store = AsyncMock(side_effect=[RuntimeError("db down"), None])
+    dispatch = AsyncMock(return_value="next-1")
+
+    with patch(f"{MODULE}.store_result", store), \
+         patch(f"{MODULE}.start_next_queued_claim", dispatch):
+        with pytest.raises(RuntimeError):
+            await _env(heartbeats).run(finalize_claim, "c1", {"verdict": "true"})
+        assert heartbeats[-1] == {"next_claim": "next-1"}
+
+        retry_beats = []
+        next_claim = await _env(retry_beats, details=[heartbeats[-1]]).run(
+            finalize_claim, "c1", {"verdict": "true"},
+        )
+
+    assert next_claim == "next-1"
+    assert store.await_count == 2
+    assert dispatch.await_count == 1
+    assert retry_beats[-1] == {"next_claim": "next-1", "stored": True}
+
+
+async def test_finalize_retry_after_dispatch_failure_does_not_restore():
+    heartbeats = []
+    store = AsyncMock(return_value=None)
+    dispatch = AsyncMock(side_effect=[RuntimeError("temporal down"), None])
+
+    with patch(f"{MODULE}.store_result", store), \
+         patch(f"{MODULE}.start_next_queued_claim", dispatch):
+        with pytest.raises(RuntimeError):
+            await _env(heartbeats).run(finalize_claim, "c1", {"verdict": "true"})
+        assert heartbeats[-1] == {"stored": True}
+
+        next_claim = await _env([], details=[heartbeats[-1]]).run(
+            finalize_claim, "c1", {"verdict": "true"},
+        )
+
+    assert next_claim is None
+    assert store.await_count == 1
+    assert dispatch.await_count == 2
+
+
+async def test_finalize_without_chain_queue_never_dispatches():
+    heartbeats = []
+    store = AsyncMock(return_value=None)
+    dispatch = AsyncMock(return_value="next-1")
+
+    with patch(f"{MODULE}.store_result", store), \
+         patch(f"{MODULE}.start_next_queued_claim", dispatch):
+        next_claim = await _env(heartbeats).run(
+            finalize_claim, "c1", {"verdict": "true"}, None, None, False,
+        )
+
+    assert next_claim is None
+    store.assert_awaited_once()
+    dispatch.assert_not_awaited()
+    assert heartbeats == [{"stored": True}]
+
+
+# ---------- degraded results are never cached ----------
+
+async def test_decompose_fallback_is_not_cached():
+    fallback = {
+        "facts": [{"text": "claim"}],
+        "thesis_info": {"thesis": None, "interested_parties": _parties()},
+        "speaker_description": "",
+    }
+    decompose = AsyncMock(return_value=fallback)
+    decompose_claim.cache_clear()
+
+    with patch.dict(sys.modules, _agent("decompose", decompose=decompose,
+                                        normalize_interested_parties=_parties)), \
+         patch(f"{MODULE}._load_decomposition", AsyncMock(return_value=None)), \
+         patch(f"{MODULE}._store_decomposition", AsyncMock()) as store:
+        env = ActivityEnvironment()
+        await env.run(decompose_claim, "claim")
+        await env.run(decompose_claim, "claim")
+
+    assert decompose.await_count == 2
+    store.assert_not_awaited()
+
+
+async def test_failed_judgment_is_not_cached():
+    failed = {"sub_claim": "fact", "verdict": "unverifiable", "confidence": 0.0}
+    judge = AsyncMock(return_value=failed)
+    judge_subclaim.cache_clear()
+
+    with patch.dict(sys.modules, {
+        **_agent("judge", judge=judge),
+        **_agent("decompose", normalize_interested_parties=_parties),
+    }):
+        env = ActivityEnvironment()
+        await env.run(judge_subclaim, "claim", "fact", [{"content": "x"}])
+        await env.run(judge_subclaim, "claim", "fact", [{"content": "x"}])
+
+    assert judge.await_count == 2
+
+
+async def test_empty_research_is_not_cached():
+    research = AsyncMock(return_value=([], {}))
+    research_subclaim.cache_clear()
+
+    with patch.dict(sys.modules, _agent("research", research_claim=research)):
+        env = ActivityEnvironment()
+        first = await env.run(research_subclaim, "fact")
+        await env.run(research_subclaim, "fact")
+
+    assert first["evidence"] == []
+    assert research.await_count == 2
+
+
+# ---------- research_and_judge ----------
+
+async def test_research_and_judge_retry_reuses_checkpointed_research():
+    research = {
+        "evidence": [{"content": "x" * 300}],
+        "enriched_parties": {"all_parties": ["B", "C"], "affiliated_media": ["M"]},
+    }
+    research_fn = AsyncMock(return_value=research)
+    judge_fn = AsyncMock(side_effect=[RuntimeError("llm down"),
+                                      {"verdict": "true", "confidence": 0.9}])
+    parties = {"all_parties": ["A", "B"], "affiliated_media": [], "media": []}
+
+    heartbeats = []
+    with patch(f"{MODULE}.research_subclaim", research_fn), \
+         patch(f"{MODULE}.judge_subclaim", judge_fn):
+        with pytest.raises(RuntimeError):
+            await _env(heartbeats).run(research_and_judge, "claim", "fact", parties)
+        assert heartbeats == [research]
+
+        out = await _env([], details=heartbeats).run(
+            research_and_judge, "claim", "fact", parties,
+        )
+
+    research_fn.assert_awaited_once()
+    assert judge_fn.await_count == 2
+    assert out == {"judgment": {"verdict": "true", "confidence": 0.9},
+                   "evidence_count": 1, "party_count": 3}
+    merged = judge_fn.await_args.args[3]
+    assert merged["all_parties"] == ["A", "B", "C"]
+    assert merged["affiliated_media"] == ["M"]
+    assert merged["media"] == []
+
+
+async def test_research_and_judge_caps_merged_parties():
+    research_fn = AsyncMock(return_value={
+        "evidence": [],
+        "enriched_parties": {"all_parties": ["B", "C", "D"]},
+    })
+    judge_fn = AsyncMock(return_value={"verdict": "unverifiable", "confidence": 0.0})
+
+    with patch(f"{MODULE}.research_subclaim", research_fn), \
+         patch(f"{MODULE}.judge_subclaim", judge_fn):
+        out = await ActivityEnvironment().run(
+            research_and_judge, "claim", "fact", {"all_parties": ["A"]},
+            None, None, None, None, None, "", "", 2,
+        )
+
+    assert out["party_count"] == 2
+    assert judge_fn.await_args.args[3]["all_parties"] == ["A", "B"]
@@ -0,0 +1,106 @@
+"""Tests for the deterministic helpers in VerifyClaimWorkflow."""
+
+import asyncio
+import os
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from temporalio.exceptions import ActivityError, ApplicationError, TimeoutType
+from temporalio.exceptions import TimeoutError as ActivityTimeoutError
+
+# synthesize imports src.llm.client, which refuses to import without an
+# endpoint configured
+os.environ.setdefault("LLAMA_URL", "http://localhost:3101")
+
+from src.llm import LLMInvocationError  # noqa: E402
+from src.workflows.verify import (  # noqa: E402
+    UNANIMOUS_MIN_CONFIDENCE, _AdaptiveLimit, _unanimous_result,
+)
+
+
+def _sub(verdict="true", confidence=0.95, reasoning="ok"):
+    return {"sub_claim": "fact", "verdict": verdict,
+            "confidence": confidence, "reasoning": reasoning}
+
+
+def test_unanimous_empty_input_falls_through():
+    assert _unanimous_result("claim", []) is None
+
+
+def test_unanimous_disagreeing_verdicts_fall_through():
+    subs = [_sub("true"), _sub("mostly_true")]
+    assert _unanimous_result("claim", subs) is None
+
+
+def test_unanimous_below_threshold_falls_through():
+    subs = [_sub(), _sub(confidence=UNANIMOUS_MIN_CONFIDENCE - 0.01)]
+    assert _unanimous_result("claim", subs) is None
+
+
+async def test_unanimous_result_matches_synthesize_shape():
+    subs = [_sub(confidence=0.97, reasoning="a"), _sub(confidence=0.92, reasoning="b")]
+    result = _unanimous_result("claim", subs)
+
+    assert result["verdict"] == "true"
+    assert result["confidence"] == 0.92
+    assert result["child_results"] == subs
+    assert result["reasoning_chain"] == ["a", "b"]
+
+    from src.agent.synthesize import synthesize
+    with patch("src.agent.synthesize.invoke_llm",
+               AsyncMock(side_effect=LLMInvocationError("down", attempts=1))):
+        synthesized = await synthesize("claim", subs)
+    assert result.keys() == synthesized.keys()
+
+
+def _activity_error(cause: Exception) -> ActivityError:
+    err = ActivityError("activity failed", scheduled_event_id=1,
+                        started_event_id=2, identity="w", activity_type="a",
+                        activity_id="1", retry_state=None)
+    err.__cause__ = cause
+    return err
+
+
+async def _fail(limit: _AdaptiveLimit, exc: Exception) -> None:
+    with pytest.raises(type(exc)):
+        async with limit:
+            raise exc
+
+
+async def test_limit_halves_on_capacity_failures_and_recovers():
+    limit = _AdaptiveLimit(4)
+    await _fail(limit, _activity_error(
+        ActivityTimeoutError("timed out", type=TimeoutType.START_TO_CLOSE,
+                             last_heartbeat_details=[])))
+    assert limit.limit == 2
+    await _fail(limit, _activity_error(
+        ApplicationError("busy", type="InternalServerError")))
+    assert limit.limit == 1
+
+    async with limit:
+        pass
+    assert limit.limit == 2
+
+
+async def test_limit_ignores_non_capacity_failures():
+    limit = _AdaptiveLimit(2)
+    await _fail(limit, _activity_error(
+        ApplicationError("bad input", type="ValueError", non_retryable=True)))
+    await _fail(limit, RuntimeError("tool error"))
+    assert limit.limit == 2
+
+
+async def test_limit_caps_concurrency():
+    limit = _AdaptiveLimit(1)
+    active, peak = 0, 0
+
+    async def task():
+        nonlocal active, peak
+        async with limit:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+    await asyncio.gather(*(task() for _ in range(3)))
+    assert peak == 1